@@ -0,0 +1,519 @@
+"""Performance harnesses for the hero's journey
+
+`pages` drives each page headlessly through Streamlit's AppTest. `load` starts a real server
+and walks many concurrent websocket sessions through the journey. `startup` times a fresh
+worker from spawn to its first landing page and profiles the imports along the way.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import urllib.request
+
+import streamlit as st
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.NumberInput_pb2 import NumberInput
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from streamlit.testing.v1 import AppTest
+
+import calculations
+import figure_registry
+from streamlit_app import CHART_BYTES_BUDGET, PAGES, PAYCHECK_LIMITS
+
+try:
+    import websockets  # Ships with Streamlit's uvicorn server; older tornado builds lack it
+except ImportError:
+    websockets = None
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'streamlit_app.py')
+SERVE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'serve.py')
+BASELINES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bench_baselines.json')
+COLD_START_BUDGET_MS = 1500  # Spawn to first landing page served, on a developer laptop
+
+# Latency is stored as a multiple of this script's warm run on the same machine, so baselines
+# carry across machines; bytes and memory don't depend on the machine and stay absolute
+REFERENCE_SCRIPT = """
+import numpy as np
+import streamlit as st
+
+for row in range(50):
+    st.markdown(f"Row {row}: {np.arange(10_000).sum():,}")
+"""
+LATENCY_METRICS = ('cold_x', 'warm_x')
+ABSOLUTE_TOLERANCE = 0.1  # Allowed growth of memory and payload bytes over baseline
+
+def clear_caches():
+    """Empty every process-wide cache so the next script run starts cold"""
+    
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    calculations.load_history.cache_clear()
+    calculations.savings_trajectory.cache_clear()
+    calculations.wage_distribution.cache_clear()
+    calculations.sensitivity_grid.cache_clear()
+    calculations.purchasing_power_path.cache_clear()
+    figure_registry.clear()
+
+def measure_page(page, warm_runs=5):
+    """Cold and warm script-run latency, peak traced memory and figure bytes for one page"""
+    
+    clear_caches()
+    at = AppTest.from_file(APP_PATH, default_timeout=60)
+    at.session_state.current_page = page
+    
+    started = time.perf_counter()
+    at.run()
+    cold_ms = (time.perf_counter() - started) * 1000
+    
+    if at.exception:
+        raise RuntimeError(f"{page} failed to render: {at.exception[0].value}")
+    
+    warm = []
+    for _ in range(warm_runs):
+        started = time.perf_counter()
+        at.run()
+        warm.append((time.perf_counter() - started) * 1000)
+    
+    # Traced separately - tracemalloc slows the run it watches
+    tracemalloc.start()
+    at.run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    chart_bytes = [len(chart.proto.spec) for chart in at.get('plotly_chart')]
+    return {
+        'cold_ms': round(cold_ms, 1),
+        'warm_ms': round(statistics.median(warm), 1),
+        'peak_kib': round(peak / 1024, 1),
+        'figure_bytes': sum(chart_bytes),
+        'max_chart_bytes': max(chart_bytes, default=0),
+    }
+
+def reference_ms(runs=5):
+    """Median warm run of REFERENCE_SCRIPT - this machine's speed at a plain script run"""
+    
+    at = AppTest.from_string(REFERENCE_SCRIPT, default_timeout=60)
+    at.run()
+    
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        at.run()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+def relative_metrics(metrics, reference):
+    """A page's metrics as stored in baselines: latency relative to the reference run"""
+    
+    return {
+        'cold_x': round(metrics['cold_ms'] / reference, 2),
+        'warm_x': round(metrics['warm_ms'] / reference, 2),
+        **{metric: value for metric, value in metrics.items() if not metric.endswith('_ms')},
+    }
+
+def check_baselines(results, baselines, tolerance):
+    """Every metric that exceeds its stored baseline by more than its tolerance
+    
+    Relative latency gets the given tolerance; memory and bytes get ABSOLUTE_TOLERANCE.
+    """
+    
+    failures = []
+    for page, metrics in results.items():
+        for metric, value in metrics.items():
+            allowed = tolerance if metric in LATENCY_METRICS else ABSOLUTE_TOLERANCE
+            baseline = baselines.get(page, {}).get(metric)
+            if baseline is not None and value > baseline * (1 + allowed):
+                failures.append(f"{page}.{metric}: {value:,} > {baseline:,} (+{allowed:.0%})")
+    return failures
+
+def bench_pages(args):
+    """Benchmark every page and compare against (or rewrite) the stored baselines"""
+    
+    # Each page is timed on its own, not racing a background warm-up of the page after it
+    os.environ['HERO_PREFETCH'] = '0'
+    results = {page: measure_page(page, args.warm_runs) for page in PAGES}
+    reference = reference_ms(args.warm_runs)
+    
+    print(f"Reference script run: {reference:,.1f} ms (latency below is also shown as x this)")
+    print(f"{'page':<26}{'cold ms':>10}{'cold x':>8}{'warm ms':>10}{'warm x':>8}{'peak KiB':>10}"
+          f"{'fig bytes':>11}{'max chart':>11}")
+    for page, metrics in results.items():
+        print(f"{page:<26}{metrics['cold_ms']:>10,.1f}{metrics['cold_ms'] / reference:>8,.2f}"
+              f"{metrics['warm_ms']:>10,.1f}{metrics['warm_ms'] / reference:>8,.2f}"
+              f"{metrics['peak_kib']:>10,.1f}{metrics['figure_bytes']:>11,}"
+              f"{metrics['max_chart_bytes']:>11,}")
+    relative = {page: relative_metrics(metrics, reference) for page, metrics in results.items()}
+    
+    # The per-chart transport budget holds regardless of baselines
+    over_budget = [
+        f"{page}.max_chart_bytes: {metrics['max_chart_bytes']:,} > {CHART_BYTES_BUDGET:,} budget"
+        for page, metrics in results.items() if metrics['max_chart_bytes'] > CHART_BYTES_BUDGET
+    ]
+    
+    for failure in over_budget:
+        print(f"OVER BUDGET {failure}")
+    
+    if args.update_baselines:
+        with open(args.baselines, 'w') as f:
+            json.dump(relative, f, indent=2)
+            f.write('\n')
+        print(f"Baselines written to {args.baselines}")
+        return 1 if over_budget else 0
+    
+    if not os.path.exists(args.baselines):
+        print(f"No baselines at {args.baselines} - run with --update-baselines first")
+        return 1
+    
+    with open(args.baselines) as f:
+        failures = check_baselines(relative, json.load(f), args.tolerance)
+    
+    for failure in failures:
+        print(f"REGRESSION {failure}")
+    return 1 if failures or over_budget else 0
+
+def percentiles(latencies):
+    """p50/p95/p99 of a list of milliseconds"""
+    
+    if len(latencies) < 2:
+        return {'p50': latencies[0], 'p95': latencies[0], 'p99': latencies[0]} if latencies else {}
+    cuts = statistics.quantiles(latencies, n=100, method='inclusive')
+    return {'p50': cuts[49], 'p95': cuts[94], 'p99': cuts[98]}
+
+def server_rss_kib(pid):
+    """Resident and peak resident memory of a process in KiB, from /proc (Linux only)"""
+    
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            fields = dict(line.split(':', 1) for line in f)
+    except OSError:
+        return {'rss': None, 'peak': None}
+    return {'rss': int(fields['VmRSS'].split()[0]), 'peak': int(fields['VmHWM'].split()[0])}
+
+def start_server(python_options=(), stderr=subprocess.DEVNULL, script=APP_PATH):
+    """Launch the app on a free local port; returns (process, websocket url)"""
+    
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+    
+    server = subprocess.Popen(
+        [sys.executable, *python_options, '-m', 'streamlit', 'run', script,
+         '--server.headless=true', f'--server.port={port}', '--server.address=127.0.0.1',
+         '--server.fileWatcherType=none', '--browser.gatherUsageStats=false'],
+        stdout=subprocess.DEVNULL, stderr=stderr,
+    )
+    
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return server, f"ws://127.0.0.1:{port}/_stcore/stream"
+        except OSError:
+            if server.poll() is not None:
+                break
+            time.sleep(0.2)
+    
+    server.kill()
+    raise RuntimeError("Streamlit server did not become healthy")
+
+class LoadSession:
+    """One simulated visitor: a browser-like websocket session walking the journey
+    
+    Widgets are found by key (or label) in the deltas the server sends, and their values are
+    sent back the way the frontend does, fragment reruns included. Every script run is timed
+    from the rerun request to the server's script_finished message.
+    """
+    
+    def __init__(self, url, rng, think_seconds):
+        self.url = url
+        self.rng = rng
+        self.think_seconds = think_seconds
+        self.page = 'landing'
+        self.widgets = {}  # key or label -> (widget proto, fragment id)
+        self.values = {}   # widget id -> WidgetState the frontend would keep sending
+        self.runs = []     # (page, step, milliseconds)
+        self.errors = 0
+    
+    async def rerun(self, step, trigger=None, **values):
+        """Send one rerun with the given widget changes and wait for the script to finish"""
+        
+        fragment_id = ''
+        for name, value in values.items():
+            widget, fragment_id = self.widgets[name]
+            state = WidgetState(id=widget.id)
+            if isinstance(value, list):
+                state.double_array_value.data.extend(value)
+            elif getattr(widget, 'data_type', None) == NumberInput.INT:
+                state.int_value = value
+            else:
+                state.double_value = value
+            self.values[widget.id] = state
+        
+        msg = BackMsg()
+        msg.rerun_script.widget_states.widgets.extend(self.values.values())
+        if trigger:
+            widget, fragment_id = self.widgets[trigger]
+            trigger_state = WidgetState(id=widget.id, trigger_value=True)
+            msg.rerun_script.widget_states.widgets.append(trigger_state)
+        msg.rerun_script.fragment_id = fragment_id
+        
+        if not fragment_id:
+            self.widgets = {}
+        
+        started = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(await self.ws.recv())
+            kind = forward.WhichOneof('type')
+            if kind == 'script_finished':
+                break
+            if kind != 'delta' or forward.delta.WhichOneof('type') != 'new_element':
+                continue
+    
+            element = forward.delta.new_element
+            element_type = element.WhichOneof('type')
+            if element_type == 'exception':
+                self.errors += 1
+            widget = getattr(element, element_type)
+            if hasattr(widget, 'id') and hasattr(widget, 'label'):
+                name = widget.id.rsplit('-', 1)[-1]
+                fragment_id = forward.delta.fragment_id
+                self.widgets[name if name != 'None' else widget.label] = (widget, fragment_id)
+                if getattr(widget, 'type', None) == 'primary':
+                    self.widgets['next'] = (widget, fragment_id)
+        
+        self.runs.append((self.page, step, (time.perf_counter() - started) * 1000))
+    
+    async def think(self):
+        await asyncio.sleep(self.think_seconds * self.rng.uniform(0.5, 1.5))
+    
+    async def next_page(self):
+        """Click the page's primary navigation button"""
+        
+        await self.think()
+        self.page = PAGES[self.page]['next']
+        self.values = {}  # Widgets on the page just left unmount
+        await self.rerun('view', trigger='next')
+    
+    async def walk(self):
+        """landing through heros_triumph, trying each calculator along the way"""
+        
+        rng = self.rng
+        connection = websockets.connect(self.url, subprotocols=['streamlit'], max_size=None)
+        async with connection as self.ws:
+            await self.rerun('view')
+            await self.next_page()  # question_everything
+            await self.next_page()  # time_has_value
+            await self.think()
+            await self.rerun('calculate', trigger='Calculate',
+                             biweekly_paycheck_input=rng.randint(*PAYCHECK_LIMITS['biweekly']))
+            await self.next_page()  # hero_seeks_understanding
+            await self.next_page()  # same_rules_for_everyone
+            await self.think()
+            await self.rerun('calculate', trigger='Calculate',
+                             expense_input_1=rng.randint(100, 20000))
+            await self.think()
+            await self.rerun('explore', explorer_contribution=[rng.randrange(0, 5001, 50)])
+            await self.think()
+            await self.rerun('explore', sensitivity_inflation=[rng.randrange(0, 301) / 10])
+            await self.next_page()  # heros_triumph
+
+async def run_sessions(url, sessions, think_seconds, ramp_seconds, seed):
+    """Walk the journey with many concurrent sessions, starts spread over the ramp-up"""
+    
+    visitors = [LoadSession(url, random.Random(seed + i), think_seconds) for i in range(sessions)]
+    
+    async def start(visitor, delay):
+        await asyncio.sleep(delay)
+        await visitor.walk()
+    
+    await asyncio.gather(*(start(visitor, ramp_seconds * i / sessions)
+                           for i, visitor in enumerate(visitors)))
+    return visitors
+
+def bench_load(args):
+    """Concurrent-session load test against a locally started server"""
+    
+    if websockets is None:
+        print("The load harness needs the websockets package (pip install websockets)")
+        return 1
+    
+    server, url = start_server()
+    try:
+        # One untimed visitor fills the process-wide caches, so growth below is per-session cost
+        asyncio.run(run_sessions(url, 1, 0, 0, args.seed - 1))
+        memory_before = server_rss_kib(server.pid)
+    
+        started = time.perf_counter()
+        visitors = asyncio.run(run_sessions(url, args.sessions, args.think_seconds,
+                                            args.ramp_seconds, args.seed))
+        elapsed = time.perf_counter() - started
+        memory_after = server_rss_kib(server.pid)
+    finally:
+        server.terminate()
+        server.wait()
+    
+    runs = [run for visitor in visitors for run in visitor.runs]
+    errors = sum(visitor.errors for visitor in visitors)
+    
+    by_step = {}
+    for page, step, ms in runs:
+        by_step.setdefault(f"{page}:{step}", []).append(ms)
+    
+    print(f"{'script run':<38}{'runs':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, latencies in list(by_step.items()) + [('all', [ms for _, _, ms in runs])]:
+        stats = percentiles(latencies)
+        print(f"{name:<38}{len(latencies):>6}{stats['p50']:>10,.1f}{stats['p95']:>10,.1f}"
+              f"{stats['p99']:>10,.1f}")
+    
+    print(f"\n{args.sessions} sessions, {len(runs)} script runs in {elapsed:.1f}s: "
+          f"{len(runs) / elapsed:.1f} runs/s, {args.sessions / elapsed * 60:.1f} journeys/min, "
+          f"{errors} errors")
+    if memory_before['rss'] is not None:
+        growth = memory_after['rss'] - memory_before['rss']
+        print(f"Server RSS {memory_before['rss'] / 1024:,.1f} -> "
+              f"{memory_after['rss'] / 1024:,.1f} MiB "
+              f"(peak {memory_after['peak'] / 1024:,.1f} MiB), "
+              f"{growth / args.sessions:,.1f} KiB per session")
+    
+    return 1 if errors else 0
+
+def parse_import_times(text):
+    """Top-level (module, milliseconds) rows of `python -X importtime` output, slowest first
+    
+    Nested imports count toward the top-level import that pulled them in.
+    """
+    
+    rows = []
+    for line in text.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if name.startswith('  '):
+            continue
+        rows.append((name.strip(), int(cumulative) / 1000))
+    return sorted(rows, key=lambda row: row[1], reverse=True)
+
+async def first_landing(url):
+    """One browser-like session's first script run (the landing page); returns its ms"""
+    
+    visitor = LoadSession(url, random.Random(0), 0)
+    async with websockets.connect(url, subprotocols=['streamlit'], max_size=None) as visitor.ws:
+        await visitor.rerun('view')
+    return visitor.runs[0][2]
+
+def measure_startup(script):
+    """Spawn a fresh server and time it to healthy, then to its first landing page served
+    
+    The server runs with -X importtime, and its log is split at the moment it turned
+    healthy: imports before are the server's own, imports after came with the first script run.
+    """
+    
+    with tempfile.TemporaryFile('w+') as log:
+        started = time.perf_counter()
+        server, url = start_server(python_options=('-X', 'importtime'), stderr=log,
+                                   script=script)
+        ready_ms = (time.perf_counter() - started) * 1000
+        try:
+            log.seek(0, os.SEEK_END)
+            split = log.tell()
+            landing_ms = asyncio.run(first_landing(url))
+            total_ms = (time.perf_counter() - started) * 1000
+        finally:
+            server.terminate()
+            server.wait()
+    
+        log.seek(0)
+        text = log.read()
+    
+    return {
+        'ready_ms': ready_ms,
+        'landing_ms': landing_ms,
+        'total_ms': total_ms,
+        'server_imports': parse_import_times(text[:split]),
+        'first_run_imports': parse_import_times(text[split:]),
+    }
+
+def bench_startup(args):
+    """Cold-start time of a worker against the budget, with the slowest imports"""
+    
+    if websockets is None:
+        print("The startup harness needs the websockets package (pip install websockets)")
+        return 1
+    
+    runs = [measure_startup(SERVE_PATH if args.serve else APP_PATH) for _ in range(args.runs)]
+    
+    print(f"{'cold start':<28}{'median ms':>12}{'max ms':>10}")
+    for name, key in [('server healthy', 'ready_ms'), ('first landing run', 'landing_ms'),
+                      ('spawn to landing served', 'total_ms')]:
+        values = [run[key] for run in runs]
+        print(f"{name:<28}{statistics.median(values):>12,.0f}{max(values):>10,.0f}")
+    
+    # Import timings come from the first (coldest) run; later ones hit a warm page cache
+    sections = [('server start', 'server_imports'), ('first landing run', 'first_run_imports')]
+    for title, key in sections:
+        rows = runs[0][key]
+        print(f"\nSlowest imports during {title} ({sum(ms for _, ms in rows):,.0f} ms in "
+              f"{len(rows)} top-level imports):")
+        for name, ms in rows[:args.top]:
+            print(f"  {name:<46}{ms:>10,.1f} ms")
+    
+    total_ms = statistics.median(run['total_ms'] for run in runs)
+    if total_ms > args.budget_ms:
+        print(f"\nOVER BUDGET: {total_ms:,.0f} ms from spawn to landing "
+              f"(budget {args.budget_ms:,.0f} ms)")
+        return 1
+    print(f"\nWithin budget: {total_ms:,.0f} ms of {args.budget_ms:,.0f} ms from spawn to landing")
+    return 0
+
+def cli(argv=None):
+    """Command-line entry point for the performance harnesses"""
+    
+    parser = argparse.ArgumentParser(prog="benchmarks.py")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    pages = commands.add_parser("pages", help="Per-page rerun latency, memory and payload")
+    pages.add_argument("--warm-runs", type=int, default=5)
+    pages.add_argument("--tolerance", type=float, default=0.5,
+                       help="Allowed growth of relative latency over baseline (0.5 = +50%%)")
+    pages.add_argument("--baselines", default=BASELINES_PATH)
+    pages.add_argument("--update-baselines", action="store_true")
+    
+    load = commands.add_parser("load", help="Concurrent sessions against a local server")
+    load.add_argument("--sessions", type=int, default=20, help="Concurrent simulated visitors")
+    load.add_argument("--think-seconds", type=float, default=2.0,
+                      help="Mean pause between a visitor's actions")
+    load.add_argument("--ramp-seconds", type=float, default=5.0,
+                      help="Spread session starts over this many seconds")
+    load.add_argument("--seed", type=int, default=1)
+    
+    startup = commands.add_parser("startup", help="Worker cold start and import profile")
+    startup.add_argument("--runs", type=int, default=3, help="Fresh servers to start")
+    startup.add_argument("--budget-ms", type=float, default=COLD_START_BUDGET_MS,
+                         help="Allowed median from spawn to first landing page served")
+    startup.add_argument("--top", type=int, default=10, help="Slowest imports listed")
+    startup.add_argument("--serve", action="store_true",
+                         help="Start through serve.py, which warms caches before turning healthy")
+    
+    args = parser.parse_args(argv)
+    
+    if args.command == "pages":
+        return bench_pages(args)
+    if args.command == "load":
+        return bench_load(args)
+    if args.command == "startup":
+        return bench_startup(args)
+
+if __name__ == "__main__":
+    sys.exit(cli())
@@ -0,0 +1,667 @@
+"""Headless calculation core for the hero's journey - NumPy only, no Streamlit or Plotly"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from functools import lru_cache
+from itertools import islice
+
+import numpy as np
+
+# Historical series live in data/history.csv (see load_history)
+HISTORY_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'history.csv')
+HISTORY_FIRST_YEAR = 1950
+
+# Time-cost assumptions
+HOURS_PER_WEEK = 40
+WEEKS_PER_YEAR = 52
+ANNUAL_HOURS = HOURS_PER_WEEK * WEEKS_PER_YEAR
+
+# Paycheck frequency -> weeks of work per paycheck
+WEEKS_PER_PAYCHECK = {
+    'weekly': 1,
+    'biweekly': 2,
+    'monthly': 4.33,  # Average weeks per month
+}
+
+# Pay records per chunk in streaming time-cost reports
+TIME_COST_CHUNK_ROWS = 100_000
+
+# Major purchases and their prices (USD)
+DEFAULT_PURCHASES = {
+    'Median House': 400000,
+    'New Car': 35000,
+    'College Degree': 40000,
+}
+
+# Pillar 2: Synthetic workforce for the population view - log-normal hourly wages
+WAGE_POPULATION = 10_000_000
+WAGE_MEDIAN = 23.11  # BLS OEWS May 2023 median hourly wage, all occupations
+WAGE_LOG_SIGMA = 0.5  # Spread of log wages (puts p10 near $12 and p90 near $44)
+MINIMUM_WAGE = 7.25  # Federal floor - lower draws count as minimum wage
+WAGE_MAXIMUM = 1000.0
+WAGE_BINS = 2048  # Log-spaced histogram bins (16 KB of counts instead of 40+ MB of wages)
+WAGE_BATCH = 1_000_000
+POPULATION_PERCENTILES = (10, 25, 50, 75, 90)
+
+# Pillar 2: 1970 vs 2024 middle-class timeline
+DAYCARE_ANNUAL = 15000  # Per child
+
+# Pillar 4: Hard money assumptions
+INFLATION_RATE = 0.10  # 10% per year (fiat debasement)
+BITCOIN_ANNUAL_APPRECIATION = 0.35  # 35% per year (historical power law average)
+YEARS = 10
+MAX_TRAJECTORY_YEARS = 50
+
+# Long-horizon purchasing power timeline: the fixed-rate projection at weekly steps, sliced coarser
+TIMELINE_MAX_YEARS = 100
+TIMELINE_STEPS_PER_YEAR = 52
+
+# Sensitivity grid: savings percentage over every inflation × appreciation × horizon point
+SENSITIVITY_AXES = {
+    'inflation_rate': np.linspace(0.0, 0.30, 61),  # 0.5% steps
+    'appreciation_rate': np.linspace(0.0, 1.0, 101),  # 1% steps
+    'years': np.arange(1, MAX_TRAJECTORY_YEARS + 1, dtype=np.float64),
+}
+for axis_values in SENSITIVITY_AXES.values():
+    axis_values.setflags(write=False)
+
+# Monte Carlo scenario defaults
+MONTE_CARLO_PATHS = 100_000
+MONTE_CARLO_BATCH = 10_000
+INFLATION_VOLATILITY = 0.03  # Yearly standard deviation of inflation
+APPRECIATION_VOLATILITY = 0.60  # Yearly standard deviation of hard money appreciation
+PERCENTILES = (5, 50, 95)
+SIMULATED_SERIES = ('fiat_expense', 'hard_money_expense', 'fiat_savings', 'hard_money_savings')
+
+# Calculator formulas shared with the browser component (components/hero_calculators):
+# plain arithmetic on names, so each string is valid Python and JavaScript alike
+FORMULAS = {
+    'hourly_wage': 'paycheck / weeks_per_paycheck / HOURS_PER_WEEK',
+    'hours': 'price / hourly_wage',
+    'years': 'hours / ANNUAL_HOURS',
+    'fiat_expense': 'expense * (1 + inflation_rate) ** horizon_years',
+    'hard_money_expense': 'expense / (1 + appreciation_rate - inflation_rate) ** horizon_years',
+}
+FORMULA_CONSTANTS = {'HOURS_PER_WEEK': HOURS_PER_WEEK, 'ANNUAL_HOURS': ANNUAL_HOURS}
+COMPILED_FORMULAS = {name: compile(expression, f"<formula {name}>", 'eval')
+                     for name, expression in FORMULAS.items()}
+
+def build_history_table(csv_path):
+    """Pivot the long-format history CSV into a dense series × year table (NaN = no data)"""
+    
+    with open(csv_path, newline='') as f:
+        records = list(csv.DictReader(line for line in f if not line.startswith('#')))
+    
+    series = sorted({record['series'] for record in records})
+    rows = {name: i for i, name in enumerate(series)}
+    last_year = max(int(record['year']) for record in records)
+    
+    values = np.full((len(series), last_year - HISTORY_FIRST_YEAR + 1), np.nan)
+    for record in records:
+        column = int(record['year']) - HISTORY_FIRST_YEAR
+        values[rows[record['series']], column] = float(record['value'])
+    return series, values
+
+@lru_cache(maxsize=None)
+def load_history(csv_path=HISTORY_CSV):
+    """Lazily load the history table as a read-only memory map shared by every session"""
+    
+    table_path = csv_path[:-len('.csv')] + '.npy'
+    index_path = csv_path[:-len('.csv')] + '.index.json'
+    
+    if not os.path.exists(table_path) or os.path.getmtime(table_path) < os.path.getmtime(csv_path):
+        series, values = build_history_table(csv_path)
+        try:
+            # Index first, table last, each swapped in whole - a fresh table implies its index
+            tmp_index = f"{index_path}.{os.getpid()}.tmp"
+            with open(tmp_index, 'w') as f:
+                json.dump({'series': series, 'first_year': HISTORY_FIRST_YEAR}, f)
+            os.replace(tmp_index, index_path)
+    
+            tmp_table = f"{table_path}.{os.getpid()}.tmp"
+            with open(tmp_table, 'wb') as f:
+                np.save(f, values)
+            os.replace(tmp_table, table_path)
+        except OSError:
+            # Read-only deploy - keep a private in-memory copy
+            values.setflags(write=False)
+            return {
+                'values': values,
+                'rows': {name: i for i, name in enumerate(series)},
+                'first_year': HISTORY_FIRST_YEAR,
+            }
+    
+    with open(index_path) as f:
+        index = json.load(f)
+    
+    return {
+        'values': np.load(table_path, mmap_mode='r'),
+        'rows': {name: i for i, name in enumerate(index['series'])},
+        'first_year': index['first_year'],
+    }
+
+def history_series(series, years):
+    """Observations of one series for many years in a single row slice (NaN = no data)"""
+    
+    history = load_history()
+    columns = np.asarray(years) - history['first_year']
+    
+    if np.any(columns < 0) or np.any(columns >= history['values'].shape[1]):
+        raise KeyError(f"{series} has no data outside {history['first_year']}-"
+                       f"{history['first_year'] + history['values'].shape[1] - 1}")
+    
+    return np.asarray(history['values'][history['rows'][series], columns])
+
+def history_value(series, year):
+    """One observation of a historical series - an O(1) row/column lookup"""
+    
+    value = float(history_series(series, year))
+    if np.isnan(value):
+        raise KeyError(f"No {series} data for {year}")
+    return value
+
+def evaluate_formula(name, **values):
+    """Evaluate one shared calculator formula on scalars or NumPy arrays"""
+    return eval(COMPILED_FORMULAS[name], {'__builtins__': {}}, {**FORMULA_CONSTANTS, **values})
+
+def hourly_wage_from_paycheck(paycheck, frequency):
+    """Take-home hourly wage from a paycheck, assuming 40 hours/week"""
+    
+    if frequency not in WEEKS_PER_PAYCHECK:
+        raise ValueError(f"Unknown pay frequency: {frequency}")
+    
+    return evaluate_formula('hourly_wage', paycheck=np.asarray(paycheck, dtype=np.float64),
+                            weeks_per_paycheck=WEEKS_PER_PAYCHECK[frequency])
+
+def time_cost_matrix(prices, hourly_wages):
+    """Hours and years of work for every purchase × wage pair in one vectorized pass"""
+    
+    prices = np.asarray(prices, dtype=np.float64).reshape(-1, 1)
+    hourly_wages = np.asarray(hourly_wages, dtype=np.float64).reshape(1, -1)
+    
+    if np.any(hourly_wages <= 0):
+        raise ValueError("A hero's time has value - hourly wages must be above zero")
+    
+    hours = evaluate_formula('hours', price=prices, hourly_wage=hourly_wages)
+    years = evaluate_formula('years', hours=hours)
+    return hours, years
+
+def benchmark_time_cost(n_purchases=1000, n_wages=1000, repeats=5):
+    """Best-of-N throughput of time_cost_matrix in purchase × wage cells per second"""
+    
+    rng = np.random.default_rng(0)
+    prices = rng.uniform(100, 1_000_000, n_purchases)
+    hourly_wages = rng.uniform(7.25, 200, n_wages)  # Federal minimum wage and up
+    
+    best = float('inf')
+    for _ in range(repeats):
+        started = time.perf_counter()
+        time_cost_matrix(prices, hourly_wages)
+        best = min(best, time.perf_counter() - started)
+    
+    cells = n_purchases * n_wages
+    return {'cells': cells, 'seconds': best, 'cells_per_second': cells / best}
+
+def weeks_per_paycheck(frequencies):
+    """Weeks per paycheck for each frequency label, NaN when unknown ('Bi-weekly' -> 'biweekly')"""
+    
+    # One dictionary lookup per distinct label, then a vectorized gather
+    labels, inverse = np.unique(np.asarray(frequencies, dtype=str), return_inverse=True)
+    weeks = np.array([
+        WEEKS_PER_PAYCHECK.get(label.strip().lower().replace('-', '').replace(' ', ''), np.nan)
+        for label in labels
+    ], dtype=np.float64)
+    return weeks[inverse.reshape(-1)]
+
+def parse_amounts(values):
+    """Parse numeric strings into floats, NaN where a value isn't a number"""
+    
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except ValueError:
+        amounts = np.full(len(values), np.nan)
+        for i, value in enumerate(values):
+            try:
+                amounts[i] = float(value)
+            except ValueError:
+                pass
+        return amounts
+
+def csv_text_column(values):
+    """Free-text values ready for a '%s' CSV field - all quoted if any has a special character"""
+    
+    if any(char in '\x00'.join(values) for char in ',"\r\n'):
+        return ['"' + value.replace('"', '""') + '"' for value in values]
+    return values
+
+def time_cost_report(in_file, out_file, chunk_rows=TIME_COST_CHUNK_ROWS):
+    """Stream pay records (CSV with paycheck and frequency columns, id optional) into time-costs
+    
+    Reads and writes one chunk of rows at a time, so memory stays flat for any input size.
+    Rows with an unknown frequency or a paycheck that isn't a positive number are skipped.
+    """
+    
+    started = time.perf_counter()
+    reader = csv.reader(in_file)
+    header = [name.strip().lower() for name in next(reader, [])]
+    if not header:
+        raise ValueError("The input is empty - expected a header row")
+    if 'paycheck' not in header or 'frequency' not in header:
+        raise ValueError("Pay records need 'paycheck' and 'frequency' columns")
+    
+    pay_column = header.index('paycheck')
+    frequency_column = header.index('frequency')
+    id_column = header.index('id') if 'id' in header else None
+    prices = list(DEFAULT_PURCHASES.values())
+    
+    writer = csv.writer(out_file)
+    writer.writerow(['id', 'frequency', 'paycheck', 'hourly_wage']
+                    + [f"{name} hours" for name in DEFAULT_PURCHASES]
+                    + [f"{name} years" for name in DEFAULT_PURCHASES])
+    
+    # One %-format per row is several times faster than csv.writer for float columns
+    row_format = ','.join(['%s', '%s', '%.2f', '%.4f'] + ['%.1f'] * len(prices)
+                          + ['%.2f'] * len(prices)) + '\n'
+    
+    rows = skipped = 0
+    while True:
+        chunk = list(islice(reader, chunk_rows))
+        if not chunk:
+            break
+        
+        # Short rows become blanks, which then fail validation like any other bad value
+        if min(map(len, chunk)) < len(header):
+            chunk = [row + [''] * (len(header) - len(row)) for row in chunk]
+        columns = list(zip(*chunk))
+        paychecks = parse_amounts(columns[pay_column])
+        weeks = weeks_per_paycheck(columns[frequency_column])
+        if id_column is None:
+            ids = np.arange(rows + skipped + 1, rows + skipped + len(chunk) + 1)
+        else:
+            ids = np.asarray(columns[id_column])
+        
+        valid = np.isfinite(weeks) & np.isfinite(paychecks) & (paychecks > 0)
+        hourly_wages = evaluate_formula('hourly_wage', paycheck=paychecks[valid],
+                                        weeks_per_paycheck=weeks[valid])
+        hours, years = time_cost_matrix(prices, hourly_wages)
+        
+        # Ids and frequency labels are copied from the input as written (' Weekly\n' is valid)
+        ids = ids[valid].tolist()
+        if id_column is not None:
+            ids = csv_text_column(ids)
+        
+        results = zip(
+            ids,
+            csv_text_column(np.asarray(columns[frequency_column])[valid].tolist()),
+            paychecks[valid].tolist(),
+            hourly_wages.tolist(),
+            *hours.tolist(),
+            *years.tolist(),
+        )
+        out_file.write(''.join([row_format % row for row in results]))
+        
+        rows += int(valid.sum())
+        skipped += len(chunk) - int(valid.sum())
+    
+    seconds = time.perf_counter() - started
+    return {'rows': rows, 'skipped': skipped, 'seconds': seconds,
+            'rows_per_second': (rows + skipped) / seconds if seconds else 0.0}
+
+@lru_cache(maxsize=4)
+def wage_distribution(population=WAGE_POPULATION, seed=0):
+    """Synthetic hourly wage population, binned into log-spaced counts batch by batch"""
+    
+    rng = np.random.default_rng(seed)
+    log_edges = np.linspace(np.log(MINIMUM_WAGE), np.log(WAGE_MAXIMUM), WAGE_BINS + 1)
+    bins_per_log_unit = WAGE_BINS / (log_edges[-1] - log_edges[0])
+    
+    counts = np.zeros(WAGE_BINS, dtype=np.int64)
+    for start in range(0, population, WAGE_BATCH):
+        log_wages = rng.normal(np.log(WAGE_MEDIAN), WAGE_LOG_SIGMA,
+                               min(WAGE_BATCH, population - start))
+        bins = ((log_wages - log_edges[0]) * bins_per_log_unit).astype(np.int64)
+        counts += np.bincount(np.clip(bins, 0, WAGE_BINS - 1), minlength=WAGE_BINS)
+    
+    cdf = np.concatenate([[0.0], np.cumsum(counts) / population])
+    
+    # Memoized results are shared between callers, so nobody may modify them
+    for values in (log_edges, counts, cdf):
+        values.setflags(write=False)
+    return {'log_edges': log_edges, 'counts': counts, 'cdf': cdf, 'population': population}
+
+def wage_percentiles(percentiles, distribution=None):
+    """Hourly wages at the given population percentiles (log-linear within a bin)"""
+    
+    distribution = distribution or wage_distribution()
+    quantiles = np.asarray(percentiles, dtype=np.float64) / 100
+    return np.exp(np.interp(quantiles, distribution['cdf'], distribution['log_edges']))
+
+def wage_percentile_of(hourly_wage, distribution=None):
+    """Share of the population (0-100) earning less than the given hourly wage"""
+    
+    distribution = distribution or wage_distribution()
+    log_wage = np.log(np.maximum(hourly_wage, MINIMUM_WAGE))
+    return 100 * np.interp(log_wage, distribution['log_edges'], distribution['cdf'])
+
+def purchase_years_bands(prices, percentiles=POPULATION_PERCENTILES, distribution=None):
+    """Years of labor per purchase (rows) at each population percentile (columns)
+    
+    Fewer years for higher earners, so the p-th percentile of years uses the (100-p)th wage.
+    """
+    
+    wages = wage_percentiles([100 - p for p in percentiles], distribution)
+    _, years = time_cost_matrix(prices, wages)
+    return years
+
+def college_work_hours():
+    """Hours at minimum wage for one year of college tuition, 1985 and 2022"""
+    
+    hours_1985 = history_value('college_tuition', 1985) / history_value('min_wage', 1985)
+    hours_2022 = history_value('college_tuition', 2022) / history_value('min_wage', 2022)
+    return hours_1985, hours_2022
+
+def middle_class_timelines():
+    """Years of household income for a middle-class life in 1970 and 2024"""
+    
+    years_1970 = (history_value('median_house_price', 1970)
+                  / history_value('median_family_income', 1970))
+    
+    # Timeline: 4 years college + house cost + 5 years daycare for 2 kids
+    household_income_2024 = history_value('median_household_income', 2024)
+    house_years_2024 = history_value('median_house_price', 2024) / household_income_2024
+    daycare_years = (DAYCARE_ANNUAL * 2 * 5) / household_income_2024  # 2 kids, 5 years each
+    college_years = 4
+    total_timeline_2024 = college_years + house_years_2024 + daycare_years
+    
+    return years_1970, total_timeline_2024
+
+def geometric_growth(start, contribution, monthly_factor, months):
+    """Balance after each month of compounding plus a fixed monthly contribution (closed form)"""
+    
+    growth = monthly_factor ** months
+    if np.isclose(monthly_factor, 1.0):
+        return start * growth + contribution * months
+    return start * growth + contribution * (growth - 1) / (monthly_factor - 1)
+
+@lru_cache(maxsize=256)
+def savings_trajectory(expense, monthly_contribution=0.0, inflation_rate=INFLATION_RATE,
+                       appreciation_rate=BITCOIN_ANNUAL_APPRECIATION, years=YEARS):
+    """Month-by-month fiat vs hard money expenses and savings purchasing power"""
+    
+    if not 0 < years <= MAX_TRAJECTORY_YEARS:
+        raise ValueError(f"Horizon must be between 1 month and {MAX_TRAJECTORY_YEARS} years")
+    
+    net_advantage = appreciation_rate - inflation_rate
+    if inflation_rate <= -1 or net_advantage <= -1:
+        raise ValueError("Rates must keep money above zero value")
+    
+    months = np.arange(int(round(years * 12)) + 1)
+    fiat_factor = (1 + inflation_rate) ** (1 / 12)
+    hard_money_factor = (1 + net_advantage) ** (1 / 12)
+    rates = {'expense': expense, 'inflation_rate': inflation_rate,
+             'appreciation_rate': appreciation_rate, 'horizon_years': months / 12}
+    
+    trajectory = {
+        'months': months,
+        # Expenses in fiat inflate; in hard money they get cheaper by the net advantage
+        'fiat_expense': evaluate_formula('fiat_expense', **rates),
+        'hard_money_expense': evaluate_formula('hard_money_expense', **rates),
+        # Purchasing power (today's dollars) of saving the same amount every month
+        'fiat_savings': geometric_growth(0.0, monthly_contribution, 1 / fiat_factor, months),
+        'hard_money_savings': geometric_growth(0.0, monthly_contribution, hard_money_factor,
+                                               months),
+    }
+    
+    # Memoized results are shared between callers, so nobody may modify them
+    for values in trajectory.values():
+        values.setflags(write=False)
+    return trajectory
+
+@lru_cache(maxsize=1)
+def sensitivity_grid():
+    """Hard money savings (% of the fiat expense) at every grid point - 1.2 MB of float32"""
+    
+    inflation, appreciation, years = np.meshgrid(*SENSITIVITY_AXES.values(), indexing='ij',
+                                                 sparse=True)
+    rates = {'expense': 1.0, 'inflation_rate': inflation, 'appreciation_rate': appreciation,
+             'horizon_years': years}
+    
+    fiat_expense = evaluate_formula('fiat_expense', **rates)
+    hard_money_expense = evaluate_formula('hard_money_expense', **rates)
+    table = (100 * (1 - hard_money_expense / fiat_expense)).astype(np.float32)
+    
+    # Memoized results are shared between callers, so nobody may modify them
+    table.setflags(write=False)
+    return table
+
+def interpolate_axis(table, axis, axis_values, value):
+    """Collapse one grid axis by linear interpolation at value (clamped to the axis range)"""
+    
+    position = float(np.interp(value, axis_values, np.arange(len(axis_values))))
+    lower = min(int(position), len(axis_values) - 2)
+    weight = position - lower
+    return (np.take(table, lower, axis=axis) * (1 - weight)
+            + np.take(table, lower + 1, axis=axis) * weight)
+
+def sensitivity_slice(**fixed):
+    """The sensitivity grid with some parameters fixed, interpolated between grid points
+    
+    Keywords are SENSITIVITY_AXES names; the remaining axes keep their order.
+    """
+    
+    table = sensitivity_grid()
+    
+    # Highest axis first, so the indices of the axes still to collapse don't shift
+    for axis, name in reversed(list(enumerate(SENSITIVITY_AXES))):
+        if name in fixed:
+            table = interpolate_axis(table, axis, SENSITIVITY_AXES[name], fixed[name])
+    return table
+
+def sensitivity_lookup(inflation_rate, appreciation_rate, years):
+    """Savings percentage at any point inside the grid (trilinear interpolation)"""
+    return float(sensitivity_slice(inflation_rate=inflation_rate,
+                                   appreciation_rate=appreciation_rate, years=years))
+
+@lru_cache(maxsize=1)
+def purchasing_power_path():
+    """Weekly purchasing power of one dollar in fiat and hard money over TIMELINE_MAX_YEARS
+    
+    The fixed-rate projection at the default inflation and appreciation rates - the same
+    assumptions as savings_trajectory; run_monte_carlo covers how uncertain they are.
+    """
+    
+    years = np.arange(TIMELINE_MAX_YEARS * TIMELINE_STEPS_PER_YEAR + 1) / TIMELINE_STEPS_PER_YEAR
+    path = {
+        'years': years,
+        'fiat': (1 + INFLATION_RATE) ** -years,
+        'hard_money': (1 + BITCOIN_ANNUAL_APPRECIATION) ** years,
+    }
+    
+    # Memoized results are shared between callers, so nobody may modify them
+    for values in path.values():
+        values.setflags(write=False)
+    return path
+
+def purchasing_power_timeline(years=TIMELINE_MAX_YEARS, steps_per_year=12):
+    """The purchasing power path over the first years, at 1 (yearly) to 52 (weekly) steps a year"""
+    
+    if not 0 < years <= TIMELINE_MAX_YEARS:
+        raise ValueError(f"Horizon must be between 1 and {TIMELINE_MAX_YEARS} years")
+    if not 1 <= steps_per_year <= TIMELINE_STEPS_PER_YEAR:
+        raise ValueError(f"Resolution must be between 1 and {TIMELINE_STEPS_PER_YEAR} "
+                         "steps per year")
+    
+    path = purchasing_power_path()
+    steps = np.arange(int(round(years * steps_per_year)) + 1)
+    weeks = np.rint(steps * TIMELINE_STEPS_PER_YEAR / steps_per_year).astype(np.intp)
+    return {name: values[weeks] for name, values in path.items()}
+
+def lttb_indices(x, series, points):
+    """Largest-Triangle-Three-Buckets: indices of the points that best keep the series' shape
+    
+    The first and last points are always kept; each bucket in between contributes the point
+    forming the largest triangle with the previous pick and the next bucket's average. Several
+    series (rows of a 2-D array) share one set of x positions by summing their triangle areas.
+    """
+    
+    x = np.asarray(x, dtype=np.float64)
+    series = np.atleast_2d(np.asarray(series, dtype=np.float64))
+    n = len(x)
+    if points >= n or points < 3:
+        return np.arange(n)
+    
+    edges = np.linspace(1, n - 1, points - 1).astype(np.intp)
+    chosen = np.empty(points, dtype=np.intp)
+    chosen[0], chosen[-1] = 0, n - 1
+    
+    for bucket in range(points - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        if bucket + 2 < len(edges):
+            next_x = x[stop:edges[bucket + 2]].mean()
+            next_y = series[:, stop:edges[bucket + 2]].mean(axis=1, keepdims=True)
+        else:
+            next_x, next_y = x[-1], series[:, -1:]
+    
+        previous = chosen[bucket]
+        px, py = x[previous], series[:, previous:previous + 1]
+        # Twice the triangle area, summed over the series
+        areas = np.abs((px - next_x) * (series[:, start:stop] - py)
+                       - (px - x[start:stop]) * (next_y - py)).sum(axis=0)
+        chosen[bucket + 1] = start + int(np.argmax(areas))
+    
+    return chosen
+
+def draw_annual_rates(rng, distribution, mean, volatility, size):
+    """Yearly rates from a normal or fat-tailed (unit-variance Student-t, 3 dof) distribution"""
+    
+    if distribution == 'normal':
+        shocks = rng.standard_normal(size)
+    elif distribution == 'fat_tailed':
+        shocks = rng.standard_t(3, size) / np.sqrt(3)
+    else:
+        raise ValueError(f"Unknown distribution: {distribution}")
+    
+    # A year can't wipe out more than 95% of a currency's value
+    return np.maximum(mean + volatility * shocks, -0.95)
+
+def simulate_batch(seed, n_paths, scenario):
+    """One batch of yearly inflation/appreciation paths as (n_paths, years + 1) arrays"""
+    
+    rng = np.random.default_rng(seed)
+    size = (n_paths, scenario['years'])
+    
+    inflation = draw_annual_rates(rng, scenario['distribution'], scenario['inflation_rate'],
+                                  scenario['inflation_volatility'], size)
+    appreciation = draw_annual_rates(rng, scenario['distribution'], scenario['appreciation_rate'],
+                                     scenario['appreciation_volatility'], size)
+    
+    fiat_growth = np.cumprod(1 + inflation, axis=1)
+    hard_money_growth = np.cumprod(1 + np.maximum(appreciation - inflation, -0.95), axis=1)
+    
+    # Each year's savings compound from the year they were put away
+    annual_contribution = 12 * scenario['monthly_contribution']
+    fiat_savings = annual_contribution * np.cumsum(fiat_growth, axis=1) / fiat_growth
+    hard_money_savings = (annual_contribution * hard_money_growth
+                          * np.cumsum(1 / hard_money_growth, axis=1))
+    
+    expense = scenario['expense']
+    start = np.ones((n_paths, 1))
+    return {
+        'fiat_expense': np.hstack([start * expense, expense * fiat_growth]).astype(np.float32),
+        'hard_money_expense': np.hstack([start * expense,
+                                         expense / hard_money_growth]).astype(np.float32),
+        'fiat_savings': np.hstack([start * 0, fiat_savings]).astype(np.float32),
+        'hard_money_savings': np.hstack([start * 0, hard_money_savings]).astype(np.float32),
+    }
+
+def run_monte_carlo(scenario, paths=MONTE_CARLO_PATHS, seed=0, pool=None, progress=None):
+    """p5/p50/p95 bands per year for every simulated series, batches spread over a pool
+    
+    progress(done, total) is called as batches finish; an exception it raises stops the run,
+    and batches not yet started are dropped.
+    """
+    
+    batch_sizes = [min(MONTE_CARLO_BATCH, paths - start)
+                   for start in range(0, paths, MONTE_CARLO_BATCH)]
+    seeds = np.random.SeedSequence(seed).spawn(len(batch_sizes))
+    
+    batches = []
+    if pool is None:
+        for s, n in zip(seeds, batch_sizes):
+            batches.append(simulate_batch(s, n, scenario))
+            if progress is not None:
+                progress(len(batches), len(batch_sizes))
+    else:
+        futures = [pool.submit(simulate_batch, s, n, scenario) for s, n in zip(seeds, batch_sizes)]
+        try:
+            for future in futures:
+                batches.append(future.result())
+                if progress is not None:
+                    progress(len(batches), len(futures))
+        finally:
+            for future in futures:
+                future.cancel()
+    
+    return {
+        series: np.percentile(np.vstack([batch[series] for batch in batches]), PERCENTILES, axis=0)
+        for series in SIMULATED_SERIES
+    }
+
+def cli(argv=None):
+    """Command-line tools for batch jobs - no Streamlit or Plotly import"""
+    
+    parser = argparse.ArgumentParser(prog="calculations.py")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    bench = commands.add_parser("bench-time-cost", help="Time-cost engine throughput")
+    bench.add_argument("--purchases", type=int, default=1000)
+    bench.add_argument("--wages", type=int, default=1000)
+    bench.add_argument("--budget", type=float, default=1.0, help="Max seconds allowed")
+    
+    report = commands.add_parser("time-cost-report",
+                                 help="Stream a pay-record CSV into per-record time-costs")
+    report.add_argument("input", help="CSV with paycheck and frequency columns (id optional), "
+                                      "or - for stdin")
+    report.add_argument("--output", default="-", help="Output CSV, or - for stdout")
+    report.add_argument("--chunk-rows", type=int, default=TIME_COST_CHUNK_ROWS)
+    
+    args = parser.parse_args(argv)
+    
+    if args.command == "bench-time-cost":
+        result = benchmark_time_cost(args.purchases, args.wages)
+        print(f"{result['cells']:,} cells in {result['seconds'] * 1000:.1f} ms "
+              f"({result['cells_per_second']:,.0f} cells/sec)")
+        return 0 if result['seconds'] <= args.budget else 1
+    
+    if args.command == "time-cost-report":
+        try:
+            in_file = sys.stdin if args.input == "-" else open(args.input, newline='')
+        except OSError as err:
+            parser.error(f"can't read {args.input}: {err.strerror}")
+        try:
+            out_file = sys.stdout if args.output == "-" else open(args.output, 'w', newline='')
+        except OSError as err:
+            parser.error(f"can't write {args.output}: {err.strerror}")
+        
+        # Bad input is the caller's mistake: a usage message and exit status 2, not a traceback
+        try:
+            result = time_cost_report(in_file, out_file, args.chunk_rows)
+        except ValueError as err:
+            parser.error(f"{'stdin' if args.input == '-' else args.input}: {err}")
+        finally:
+            for f in (in_file, out_file):
+                if f not in (sys.stdin, sys.stdout):
+                    f.close()
+        
+        # Summary on stderr, so stdout stays a clean CSV
+        print(f"{result['rows']:,} rows ({result['skipped']:,} skipped) "
+              f"in {result['seconds']:.1f} s ({result['rows_per_second']:,.0f} rows/sec)",
+              file=sys.stderr)
+        return 0
+
+if __name__ == "__main__":
+    sys.exit(cli())
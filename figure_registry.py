@@ -0,0 +1,36 @@
+"""Process-wide registry of static figures, shared by script runs and the startup warm-up
+
+Script runs execute streamlit_app.py as __main__, while serve.py imports it as streamlit_app -
+two copies of the module, and st.cache_resource keys its entries by module, so each copy
+would build its own figures. This module is only ever imported under one name, so the
+figures serve.py warms up are the ones every script run reads.
+"""
+
+import threading
+
+REGISTRY = {'entries': {}, 'hits': 0, 'misses': 0, 'lock': threading.Lock()}
+
+def get_entry(name, build):
+    """The entry registered under name, calling build() for it only on first use"""
+    
+    with REGISTRY['lock']:
+        if name in REGISTRY['entries']:
+            REGISTRY['hits'] += 1
+        else:
+            REGISTRY['misses'] += 1
+            REGISTRY['entries'][name] = build()
+        return REGISTRY['entries'][name]
+
+def registry_stats():
+    """Hit/miss counters and a copy of the registered entries"""
+    
+    with REGISTRY['lock']:
+        return {'hits': REGISTRY['hits'], 'misses': REGISTRY['misses'],
+                'entries': dict(REGISTRY['entries'])}
+
+def clear():
+    """Forget every entry and counter (benchmarks start each page cold)"""
+    
+    with REGISTRY['lock']:
+        REGISTRY['entries'].clear()
+        REGISTRY['hits'] = REGISTRY['misses'] = 0
@@ -0,0 +1,203 @@
+"""Render instrumentation: timings, allocations and figure counts exported as Prometheus text
+
+Everything is opt-in through environment variables:
+
+    HERO_METRICS_FILE=metrics.prom    rewrite a Prometheus text file every few seconds
+    HERO_METRICS_PORT=9464            serve the same text at http://127.0.0.1:<port>/metrics
+    HERO_TRACE_ALLOCATIONS=1          record tracemalloc allocation deltas per render
+    HERO_PROFILE_INTERVAL=0.01        sample app stacks every N seconds into HERO_PROFILE_FILE
+"""
+
+import functools
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+METRICS_FILE = os.environ.get('HERO_METRICS_FILE')
+METRICS_PORT = int(os.environ.get('HERO_METRICS_PORT', 0))
+TRACE_ALLOCATIONS = os.environ.get('HERO_TRACE_ALLOCATIONS') == '1'
+PROFILE_INTERVAL = float(os.environ.get('HERO_PROFILE_INTERVAL', 0))
+PROFILE_FILE = os.environ.get('HERO_PROFILE_FILE', 'hero_profile.folded')
+EXPORT_INTERVAL = 5.0  # Seconds between metrics file rewrites
+EXPORTING = bool(METRICS_FILE or METRICS_PORT)  # Whether anything reads the counters
+
+# Only frames from the app's own files show up in profiles
+APP_FILES = ('streamlit_app.py', 'calculations.py')
+
+LOCK = threading.Lock()
+RENDER_STATS = defaultdict(lambda: {
+    'calls': 0, 'wall_seconds': 0.0, 'cpu_seconds': 0.0, 'figures': 0, 'figure_bytes': 0,
+    'alloc_bytes': 0,
+})
+PAGE_RUNS = Counter()
+PROFILE_SAMPLES = Counter()
+COLLECTORS = {}  # name -> callable returning {metric_name: value} at export time
+STATE = {'last_export': 0.0, 'server': None, 'profiler': None}
+
+# Figures sent by the script run on the current thread
+SCRIPT_THREAD = threading.local()
+
+if TRACE_ALLOCATIONS and not tracemalloc.is_tracing():
+    tracemalloc.start()
+
+def count_figure(spec_bytes=0):
+    """Note that the running render sent one chart of the given serialized size to the browser"""
+    SCRIPT_THREAD.figures = getattr(SCRIPT_THREAD, 'figures', 0) + 1
+    SCRIPT_THREAD.figure_bytes = getattr(SCRIPT_THREAD, 'figure_bytes', 0) + spec_bytes
+
+def record_page_run(page):
+    """Count one script run that rendered the given page"""
+    with LOCK:
+        PAGE_RUNS[page] += 1
+
+def instrumented(func):
+    """Record wall time, CPU time, figure count and allocations for every render function call"""
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        figures_before = getattr(SCRIPT_THREAD, 'figures', 0)
+        figure_bytes_before = getattr(SCRIPT_THREAD, 'figure_bytes', 0)
+        tracing = tracemalloc.is_tracing()
+        allocated_before = tracemalloc.get_traced_memory()[0] if tracing else 0
+        wall_started = time.perf_counter()
+        cpu_started = time.thread_time()
+    
+        try:
+            return func(*args, **kwargs)
+        finally:
+            wall = time.perf_counter() - wall_started
+            cpu = time.thread_time() - cpu_started
+            allocated = tracemalloc.get_traced_memory()[0] - allocated_before if tracing else 0
+            figures = getattr(SCRIPT_THREAD, 'figures', 0) - figures_before
+            figure_bytes = getattr(SCRIPT_THREAD, 'figure_bytes', 0) - figure_bytes_before
+    
+            with LOCK:
+                stats = RENDER_STATS[func.__name__]
+                stats['calls'] += 1
+                stats['wall_seconds'] += wall
+                stats['cpu_seconds'] += cpu
+                stats['figures'] += figures
+                stats['figure_bytes'] += figure_bytes
+                stats['alloc_bytes'] += max(allocated, 0)
+    
+    return wrapper
+
+def prometheus_text():
+    """All collected metrics in the Prometheus text exposition format"""
+    
+    with LOCK:
+        renders = {name: dict(stats) for name, stats in RENDER_STATS.items()}
+        page_runs = dict(PAGE_RUNS)
+    
+    lines = []
+    
+    def family(name, kind, help_text, samples):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, value in samples:
+            label_text = ','.join(f'{key}="{val}"' for key, val in labels.items())
+            lines.append(f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}")
+    
+    for metric, help_text in (
+        ('calls', 'Render function calls (reruns included)'),
+        ('wall_seconds', 'Wall time spent in render functions'),
+        ('cpu_seconds', 'Script-thread CPU time spent in render functions'),
+        ('figures', 'Charts sent to the browser by render functions'),
+        ('figure_bytes', 'Serialized Plotly spec bytes sent by render functions'),
+        ('alloc_bytes',
+         'Net tracemalloc growth across render functions (HERO_TRACE_ALLOCATIONS=1)'),
+    ):
+        family(f"hero_render_{metric}_total", 'counter', help_text,
+               [({'function': name}, stats[metric]) for name, stats in sorted(renders.items())])
+    
+    family('hero_page_runs_total', 'counter', 'Script runs per rendered page',
+           [({'page': page}, runs) for page, runs in sorted(page_runs.items())])
+    
+    for collector in list(COLLECTORS.values()):
+        for name, value in collector().items():
+            family(name, 'gauge', 'Application counter', [({}, value)])
+    
+    return '\n'.join(lines) + '\n'
+
+def maybe_export():
+    """Rewrite the metrics and profile files if the export interval has passed"""
+    
+    if not METRICS_FILE and not PROFILE_INTERVAL:
+        return
+    
+    with LOCK:
+        now = time.monotonic()
+        if now - STATE['last_export'] < EXPORT_INTERVAL:
+            return
+        STATE['last_export'] = now
+        samples = dict(PROFILE_SAMPLES)
+    
+    if METRICS_FILE:
+        write_atomically(METRICS_FILE, prometheus_text())
+    if PROFILE_INTERVAL:
+        folded = ''.join(f"{stack} {count}\n" for stack, count in samples.items())
+        write_atomically(PROFILE_FILE, folded)
+
+def write_atomically(path, text):
+    """Replace a file in one step so scrapers never read half of it"""
+    
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """Serves prometheus_text() at /metrics"""
+    
+    def do_GET(self):
+        if self.path != '/metrics':
+            self.send_error(404)
+            return
+        body = prometheus_text().encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, *args):
+        pass
+
+def start_exporters():
+    """Start the metrics endpoint and sampling profiler once per process, if configured"""
+    
+    with LOCK:
+        if METRICS_PORT and STATE['server'] is None:
+            STATE['server'] = ThreadingHTTPServer(('127.0.0.1', METRICS_PORT), MetricsHandler)
+            threading.Thread(target=STATE['server'].serve_forever, name='hero-metrics',
+                             daemon=True).start()
+    
+        if PROFILE_INTERVAL and STATE['profiler'] is None:
+            STATE['profiler'] = threading.Thread(target=sample_stacks, args=(PROFILE_INTERVAL,),
+                                                 name='hero-profiler', daemon=True)
+            STATE['profiler'].start()
+
+def sample_stacks(interval):
+    """Sampling profiler loop: count app call stacks in collapsed (flamegraph) format"""
+    
+    profiler_thread = threading.get_ident()
+    while True:
+        time.sleep(interval)
+    
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == profiler_thread:
+                continue
+    
+            stack = []
+            while frame is not None:
+                if frame.f_code.co_filename.endswith(APP_FILES):
+                    stack.append(frame.f_code.co_name)
+                frame = frame.f_back
+    
+            if stack:
+                with LOCK:
+                    PROFILE_SAMPLES[';'.join(reversed(stack))] += 1
@@ -0,0 +1,136 @@
+"""Bounded background jobs for heavy calculations, with progress and cancel-on-change
+
+Sessions submit named jobs to one process-wide pool instead of computing on the script
+thread. A session keeps at most one job per name: submitting new inputs under a name cancels
+the outdated job. A queued job then never starts; a running one stops at its next progress
+report (threads can't be interrupted, so cancellation is cooperative). Limits come from
+environment variables:
+
+    HERO_JOB_WORKERS=2          jobs running at once in this process
+    HERO_JOB_LIMIT=16           jobs queued or running in this process before new ones are refused
+    HERO_JOB_SESSION_LIMIT=2    jobs queued or running for one session, outdated ones included
+"""
+
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+JOB_WORKERS = int(os.environ.get('HERO_JOB_WORKERS', 2))
+JOB_LIMIT = int(os.environ.get('HERO_JOB_LIMIT', 16))
+JOB_SESSION_LIMIT = int(os.environ.get('HERO_JOB_SESSION_LIMIT', 2))
+
+class JobCancelled(Exception):
+    """Raised inside a job at its next progress report once the job is outdated"""
+
+class JobRejected(Exception):
+    """A job refused because its session or the whole process is at its limit"""
+
+class Job:
+    """One submitted calculation: its inputs, future, latest progress and cancel flag"""
+    
+    __slots__ = ('name', 'inputs', 'future', 'progress', 'cancelled', 'submitted')
+    
+    def __init__(self, name, inputs):
+        self.name = name
+        self.inputs = inputs
+        self.future = None
+        self.progress = 0.0
+        self.cancelled = threading.Event()
+        self.submitted = time.monotonic()
+    
+    def report(self, done, total):
+        """Progress callback handed to the job's function; raises JobCancelled once outdated"""
+    
+        if self.cancelled.is_set():
+            raise JobCancelled(self.name)
+        self.progress = done / total
+    
+    def cancel(self):
+        """Stop the job: a queued one never starts, a running one at its next report"""
+        self.cancelled.set()
+        self.future.cancel()
+    
+    def done(self):
+        return self.future.done()
+    
+    def result(self):
+        return self.future.result()
+
+class JobRunner:
+    """A bounded thread pool that counts queued and running jobs per session and in total
+    
+    NumPy releases the GIL for the heavy work, so threads are enough - and jobs can share
+    process-wide caches, which worker processes could not.
+    """
+    
+    def __init__(self, workers=JOB_WORKERS, limit=JOB_LIMIT, session_limit=JOB_SESSION_LIMIT):
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="job")
+        self.workers = workers
+        self.limit = limit
+        self.session_limit = session_limit
+        self.active = Counter()  # session key -> jobs queued or running
+        self.lock = threading.Lock()
+        self.stats = {'submitted': 0, 'completed': 0, 'cancelled': 0, 'failed': 0, 'rejected': 0}
+    
+    def submit(self, jobs, session, name, func, **inputs):
+        """The session's job for name with these inputs, submitting it unless already current
+    
+        jobs is the session's own name -> Job dict and session any hashable key for it.
+        func(progress=job.report, **inputs) runs on the pool. A job under the same name with
+        other inputs is cancelled once the new one is accepted. Raises JobRejected when a
+        limit is reached, leaving the session's current job running.
+        """
+    
+        current = jobs.get(name)
+        if current is not None and current.inputs == inputs and not current.cancelled.is_set():
+            return current
+    
+        with self.lock:
+            if self.active[session] >= self.session_limit:
+                reason = "your earlier calculations are still running"
+            elif sum(self.active.values()) >= self.limit:
+                reason = "the server is busy with other visitors' calculations"
+            else:
+                reason = None
+                self.active[session] += 1
+            self.stats['rejected' if reason else 'submitted'] += 1
+        if reason:
+            raise JobRejected(reason)
+        if current is not None:
+            current.cancel()
+    
+        job = Job(name, inputs)
+        job.future = self.pool.submit(self.run, job, func)
+        job.future.add_done_callback(lambda future: self.finish(session, future))
+        jobs[name] = job
+        return job
+    
+    def run(self, job, func):
+        """Pool thread body: one last cancel check, then the calculation"""
+    
+        job.report(0, 1)
+        return func(progress=job.report, **job.inputs)
+    
+    def finish(self, session, future):
+        """Release the job's slots and count how it ended"""
+    
+        if future.cancelled() or isinstance(future.exception(), JobCancelled):
+            outcome = 'cancelled'
+        elif future.exception() is not None:
+            outcome = 'failed'
+        else:
+            outcome = 'completed'
+    
+        with self.lock:
+            self.active[session] -= 1
+            if not self.active[session]:
+                del self.active[session]
+            self.stats[outcome] += 1
+    
+    def summary(self):
+        """Counters plus the jobs and sessions active right now"""
+    
+        with self.lock:
+            return {**self.stats, 'active': sum(self.active.values()), 'sessions': len(self.active)}
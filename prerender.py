@@ -0,0 +1,242 @@
+"""Static export of the journey: prerendered HTML pages that a plain file server can host
+
+The non-interactive pages are rendered once through Streamlit's AppTest harness and written
+as HTML. Every page shares one locally bundled plotly.js. The calculator pages become
+hydration points that load the live Streamlit app only when a visitor scrolls to them.
+"""
+
+import argparse
+import html
+import json
+import os
+import re
+import sys
+import textwrap
+
+import plotly.offline
+from streamlit.testing.v1 import AppTest
+
+from streamlit_app import PAGES
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'streamlit_app.py')
+
+# Pages made of fixed markdown and charts - everything else needs the live app
+STATIC_PAGES = ('landing', 'question_everything', 'hero_seeks_understanding', 'heros_triumph')
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>The Hero</title>
+<link rel="stylesheet" href="assets/hero.css">
+<script src="assets/plotly.min.js" defer></script>
+<script src="assets/hero.js" defer></script>
+</head>
+<body>
+<main>
+{body}
+</main>
+</body>
+</html>
+"""
+
+STYLESHEET = """body { margin: 0; font-family: system-ui, sans-serif; color: #31333f; }
+main { max-width: 46rem; margin: 0 auto; padding: 3rem 1rem 6rem; line-height: 1.6; }
+hr { border: none; border-top: 1px solid #e6e6ea; margin: 2rem 0; }
+.columns { display: flex; gap: 1rem; flex-wrap: wrap; }
+.columns > div { flex: 1 1 0; min-width: 12rem; }
+.metric .label { font-size: 0.875rem; }
+.metric .value { font-size: 2.25rem; }
+.metric .delta { display: inline-block; color: #09ab3b; background: #e8f7ee; border-radius: 1rem;
+                 padding: 0 0.5rem; font-size: 0.875rem; }
+.tab > h4 { border-bottom: 2px solid #ff4b4b; display: inline-block; }
+.chart { min-height: 450px; }
+.button { display: inline-block; padding: 0.4rem 0.9rem; border-radius: 0.5rem;
+          text-decoration: none; border: 1px solid #d6d6d9; color: inherit; }
+.button.primary { background: #ff4b4b; border-color: #ff4b4b; color: white; }
+.hydrate iframe { width: 100%; height: 2400px; border: none; }
+"""
+
+# Charts draw from their embedded JSON; hydration points swap in the live app near the viewport
+SCRIPT = """document.querySelectorAll('.chart').forEach(function (el) {
+  var fig = JSON.parse(el.querySelector('script').textContent);
+  Plotly.newPlot(el, fig.data, fig.layout, {responsive: true, displayModeBar: false});
+});
+var observer = new IntersectionObserver(function (entries) {
+  entries.forEach(function (entry) {
+    if (!entry.isIntersecting) return;
+    var frame = document.createElement('iframe');
+    frame.src = entry.target.dataset.src;
+    entry.target.replaceChildren(frame);
+    observer.unobserve(entry.target);
+  });
+}, {rootMargin: '400px'});
+document.querySelectorAll('.hydrate').forEach(function (el) { observer.observe(el); });
+"""
+
+INLINE_PATTERNS = (
+    (re.compile(r'`([^`]+)`'), r'<code>\1</code>'),
+    (re.compile(r'\*\*(.+?)\*\*'), r'<strong>\1</strong>'),
+    (re.compile(r'\*(.+?)\*'), r'<em>\1</em>'),
+    (re.compile(r'\[([^\]]+)\]\(([^)]+)\)'), r'<a href="\2">\1</a>'),
+    (re.compile(r'\\([\\`*_{}\[\]()#+\-.!|])'), r'\1'),
+)
+LIST_ITEM = re.compile(r'^\s*(?:[-*]|\d+\.)\s+')
+
+def inline_html(text):
+    """Escape one line of markdown and apply emphasis, code and links"""
+    
+    text = html.escape(text, quote=False)
+    if text.endswith('  '):
+        text = text.rstrip() + '<br>'
+    for pattern, replacement in INLINE_PATTERNS:
+        text = pattern.sub(replacement, text)
+    return text
+
+def markdown_html(source):
+    """HTML for the markdown subset the pages use: headings, rules, lists, emphasis, raw HTML"""
+    
+    source = textwrap.dedent(source).strip()
+    if source.startswith('<style'):
+        return ''  # Streamlit chrome tweaks
+    if source.startswith('<'):
+        return source
+    
+    parts = []
+    for block in re.split(r'\n\s*\n', source):
+        lines = block.strip().split('\n')
+        paragraph, items, ordered = [], [], False
+    
+        def flush():
+            if paragraph:
+                parts.append(f"<p>{''.join(paragraph)}</p>")
+                paragraph.clear()
+            if items:
+                tag = 'ol' if ordered else 'ul'
+                parts.append(f"<{tag}>{''.join(f'<li>{item}</li>' for item in items)}</{tag}>")
+                items.clear()
+    
+        for line in lines:
+            heading = re.match(r'^(#{1,6})\s+(.*)', line.strip())
+            if line.strip() == '---':
+                flush()
+                parts.append('<hr>')
+            elif heading:
+                flush()
+                level = len(heading.group(1))
+                parts.append(f"<h{level}>{inline_html(heading.group(2))}</h{level}>")
+            elif LIST_ITEM.match(line):
+                if paragraph:
+                    flush()
+                ordered = LIST_ITEM.match(line).group().strip()[0].isdigit()
+                items.append(inline_html(LIST_ITEM.sub('', line).rstrip()))
+            else:
+                if items:
+                    flush()
+                paragraph.append(inline_html(line) + ('' if line.endswith('  ') else ' '))
+        flush()
+    
+    return '\n'.join(parts)
+
+def page_file(page):
+    """File name of a page in the exported site"""
+    return 'index.html' if page == 'landing' else f"{page}.html"
+
+def node_html(node, page):
+    """HTML for one AppTest element or block and everything inside it"""
+    
+    kind = node.type
+    children = '\n'.join(node_html(child, page) for child in getattr(node, 'children', {}).values())
+    
+    if kind == 'title':
+        return f"<h1>{html.escape(node.value)}</h1>"
+    if kind == 'markdown':
+        return markdown_html(node.value)
+    if kind == 'metric':
+        return (f"<div class=\"metric\"><div class=\"label\">{html.escape(node.label)}</div>"
+                f"<div class=\"value\">{html.escape(node.value)}</div>"
+                f"<div class=\"delta\">{html.escape(node.delta or '')}</div></div>")
+    if kind == 'plotly_chart':
+        # Streamlit's template holds theme placeholder colors the frontend swaps out; plotly.js
+        # defaults stand in for it here
+        fig = json.loads(node.proto.spec)
+        fig.get('layout', {}).pop('template', None)
+        spec = json.dumps(fig, separators=(',', ':')).replace('</', '<\\/')
+        return f"<div class=\"chart\"><script type=\"application/json\">{spec}</script></div>"
+    if kind == 'button':
+        # Navigation buttons: primary goes forward, secondary goes back (see render_navigation)
+        target = PAGES[page]['next' if node.proto.type == 'primary' else 'prev']
+        return (f"<a class=\"button {node.proto.type}\" href=\"{page_file(target)}\">"
+                f"{html.escape(node.label)}</a>")
+    if kind == 'flex_container' and node.children and all(
+        child.type == 'column' for child in node.children.values()
+    ):
+        return f"<div class=\"columns\">{children}</div>"
+    if kind == 'column':
+        return f"<div>{children}</div>"
+    if kind == 'tab':
+        return f"<section class=\"tab\"><h4>{html.escape(node.label)}</h4>\n{children}</section>"
+    return children
+
+def render_static_page(page):
+    """Prerender one non-interactive page through AppTest"""
+    
+    at = AppTest.from_file(APP_PATH, default_timeout=60)
+    at.session_state.current_page = page
+    at.run()
+    
+    if at.exception:
+        raise RuntimeError(f"{page} failed to render: {at.exception[0].value}")
+    
+    return node_html(at.main, page)
+
+def render_hydration_page(page, app_url):
+    """Shell for an interactive page: the live app loads into it as the visitor arrives"""
+    
+    src = html.escape(f"{app_url.rstrip('/')}/?page={page}&embed=true")
+    return (f"<div class=\"hydrate\" data-page=\"{page}\" data-src=\"{src}\">"
+            f"<a class=\"button primary\" href=\"{src}\">Open the live calculator</a></div>")
+
+def export_site(out_dir, app_url):
+    """Write every page plus the shared assets; returns {file name: bytes written}"""
+    
+    assets = os.path.join(out_dir, 'assets')
+    os.makedirs(assets, exist_ok=True)
+    
+    files = {
+        'assets/plotly.min.js': plotly.offline.get_plotlyjs(),
+        'assets/hero.css': STYLESHEET,
+        'assets/hero.js': SCRIPT,
+    }
+    for page in PAGES:
+        if page in STATIC_PAGES:
+            body = render_static_page(page)
+        else:
+            body = render_hydration_page(page, app_url)
+        files[page_file(page)] = PAGE_TEMPLATE.format(body=body)
+    
+    sizes = {}
+    for name, text in files.items():
+        with open(os.path.join(out_dir, name), 'w', encoding='utf-8') as f:
+            f.write(text)
+        sizes[name] = len(text.encode('utf-8'))
+    return sizes
+
+def cli(argv=None):
+    """Command-line entry point for the static export"""
+    
+    parser = argparse.ArgumentParser(prog="prerender.py")
+    parser.add_argument("--out", default="site", help="Output directory")
+    parser.add_argument("--app-url", default="http://localhost:8501",
+                        help="Live Streamlit app that hydration points load")
+    args = parser.parse_args(argv)
+    
+    sizes = export_site(args.out, args.app_url)
+    for name, size in sizes.items():
+        print(f"{name:<36}{size:>12,} bytes")
+    print(f"{len(STATIC_PAGES)} of {len(PAGES)} pages prerendered into {args.out}/")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(cli())
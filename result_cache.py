@@ -0,0 +1,177 @@
+"""Disk-backed result cache shared by every worker process on the machine
+
+Expensive scenario results (dicts of NumPy arrays) are stored in one SQLite file under a
+SHA-256 of their canonical inputs, so a scenario computed by any worker - or before a
+restart - is read back instead of recomputed. Opt-in through environment variables:
+
+    HERO_RESULT_CACHE=hero_results.sqlite    cache file (unset = no disk cache)
+    HERO_RESULT_CACHE_BYTES=268435456        stored bytes kept before least-recently-used eviction
+"""
+
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+from sqlite_store import SqliteStore
+
+CACHE_FILE = os.environ.get('HERO_RESULT_CACHE')
+CACHE_BYTES = int(os.environ.get('HERO_RESULT_CACHE_BYTES', 256 * 1024 * 1024))
+RESULT_FORMAT = 1  # Part of every key - bump when a cached function's output changes
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used);
+"""
+
+def result_key(name, inputs):
+    """Content address of one call: SHA-256 of its name and canonical JSON inputs"""
+    
+    canonical = json.dumps([RESULT_FORMAT, name, inputs], sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+def encode_result(result):
+    """A dict of arrays and scalars as .npz bytes (no pickles, so reading a file runs no code)"""
+    
+    buffer = io.BytesIO()
+    np.savez(buffer, **result)
+    return buffer.getvalue()
+
+def decode_result(blob):
+    """Inverse of encode_result; arrays come back read-only like the in-memory caches' results"""
+    
+    result = {}
+    with np.load(io.BytesIO(blob), allow_pickle=False) as arrays:
+        for name in arrays.files:
+            values = arrays[name]
+            if values.ndim == 0:
+                result[name] = values.item()
+            else:
+                values.setflags(write=False)
+                result[name] = values
+    return result
+
+class ResultCache(SqliteStore):
+    """Size-bounded LRU store in one SQLite file, safe to share between processes
+    
+    Writes take the database lock up front (BEGIN IMMEDIATE) so insert and eviction land
+    together. Any SQLite failure counts as an error and a miss - the caller just computes
+    the result.
+    """
+    
+    SCHEMA = SCHEMA
+    STATS = ('hits', 'misses', 'writes', 'evictions', 'errors')
+    
+    def __init__(self, path, max_bytes=CACHE_BYTES):
+        super().__init__(path)
+        self.max_bytes = max_bytes
+    
+    def get(self, key):
+        """The stored result for a key, or None; a hit marks the entry recently used"""
+    
+        try:
+            conn = self.connection()
+            row = conn.execute('SELECT value FROM results WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                self.count('misses')
+                return None
+            conn.execute('UPDATE results SET last_used = ? WHERE key = ?', (time.time(), key))
+            result = decode_result(row[0])
+        except (sqlite3.Error, OSError, ValueError):
+            self.count('errors')
+            self.count('misses')
+            return None
+    
+        self.count('hits')
+        return result
+    
+    def put(self, key, name, result):
+        """Store a result, then evict least-recently-used entries down to the size bound"""
+    
+        blob = encode_result(result)
+        if len(blob) > self.max_bytes:
+            return
+    
+        try:
+            with self.transaction() as conn:
+                conn.execute('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)',
+                             (key, name, blob, len(blob), time.time()))
+                evicted = self.evict(conn)
+        except (sqlite3.Error, OSError):
+            self.count('errors')
+            return
+    
+        self.count('writes')
+        self.count('evictions', evicted)
+    
+    def evict(self, conn):
+        """Drop the oldest entries until the stored bytes fit; returns how many went"""
+    
+        stored = conn.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+        excess = stored - self.max_bytes
+        if excess <= 0:
+            return 0
+    
+        doomed = []
+        for key, size in conn.execute('SELECT key, size FROM results ORDER BY last_used'):
+            doomed.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany('DELETE FROM results WHERE key = ?', doomed)
+        return len(doomed)
+    
+    def summary(self):
+        """Hit rate and counters for this process, with entries and bytes across all of them"""
+    
+        stats = self.counters()
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+    
+        try:
+            stats['entries'], stats['bytes'] = self.connection().execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results'
+            ).fetchone()
+        except sqlite3.Error:
+            stats['entries'], stats['bytes'] = 0, 0
+        return stats
+
+CACHE = {'instance': None, 'lock': threading.Lock()}
+
+def get_result_cache():
+    """The process's ResultCache, or None when HERO_RESULT_CACHE is not set"""
+    
+    if not CACHE_FILE:
+        return None
+    with CACHE['lock']:
+        if CACHE['instance'] is None:
+            CACHE['instance'] = ResultCache(CACHE_FILE)
+        return CACHE['instance']
+
+def cached_result(name, compute, **inputs):
+    """compute(**inputs), read from or written to the disk cache when one is configured
+    
+    Inputs must be JSON-serializable (numbers, strings, lists, dicts) - they are the key.
+    """
+    
+    cache = get_result_cache()
+    if cache is None:
+        return compute(**inputs)
+    
+    key = result_key(name, inputs)
+    result = cache.get(key)
+    if result is None:
+        result = compute(**inputs)
+        cache.put(key, name, result)
+    return result
@@ -0,0 +1,38 @@
+"""Server entry point that warms the app's caches in the background as soon as it starts
+
+`streamlit run streamlit_app.py` loads chart libraries and builds shared data on the first
+visitor's script run of each page. Serving through this file starts streamlit_app.warm_up()
+in the server's startup hook instead. The landing page needs none of it, so the worker takes
+connections at once, and the chart pages are warm by the time visitors click through:
+
+    streamlit run serve.py
+    uvicorn serve:app --host 0.0.0.0 --port 8501
+"""
+
+import asyncio
+import contextlib
+import os
+import time
+
+import streamlit as st
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'streamlit_app.py')
+
+def warm():
+    """Import the app and fill its process-wide caches and static figures"""
+
+    started = time.perf_counter()
+    import streamlit_app
+    streamlit_app.warm_up()
+    print(f"Warmed up in {(time.perf_counter() - started) * 1000:,.0f} ms", flush=True)
+
+@contextlib.asynccontextmanager
+async def warm_up(app):
+    """Startup hook: warm off the event loop, without holding back the first connection"""
+
+    warming = asyncio.create_task(asyncio.to_thread(warm))
+    yield
+    # A worker stopped mid warm-up lets it finish rather than leaving a half-built cache
+    await warming
+
+app = st.App(APP_PATH, lifespan=warm_up)
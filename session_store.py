@@ -0,0 +1,117 @@
+"""Optional external session store, so any worker process can pick up any visitor's journey
+
+Only the compact calculator inputs and the current page are stored, as JSON in one local
+SQLite file, under a random id that lives in the visitor's URL (?sid=...). Nothing identifies
+the visitor, and entries expire after the same idle hour that resets in-memory sessions.
+Whoever holds a URL can read that id's inputs; a resumed session saves under a new id, so it
+never overwrites the one it was copied from.
+Opt-in through an environment variable:
+
+    HERO_SESSION_STORE=hero_sessions.sqlite    store file (unset = sessions stay in process)
+"""
+
+import json
+import os
+import re
+import secrets
+import sqlite3
+import threading
+import time
+
+from sqlite_store import SqliteStore
+
+STORE_FILE = os.environ.get('HERO_SESSION_STORE')
+SESSION_ID = re.compile(r'^[A-Za-z0-9_-]{16,64}$')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_updated ON sessions (updated);
+"""
+
+def new_session_id():
+    """A random, unguessable session id (carries no information about the visitor)"""
+    return secrets.token_urlsafe(16)
+
+def valid_session_id(session_id):
+    """Whether an id from a URL has the shape new_session_id makes"""
+    return bool(session_id) and SESSION_ID.match(session_id) is not None
+
+class SessionStore(SqliteStore):
+    """Session states in one SQLite file shared by every worker on the machine
+
+    Every write is a single statement. Any SQLite failure counts as an error and leaves the
+    session in memory only.
+    """
+
+    SCHEMA = SCHEMA
+    STATS = ('loads', 'restored', 'saves', 'expired', 'errors')
+
+    def load(self, session_id, max_idle_seconds):
+        """The stored state for a session id, or None if unknown or idle too long"""
+
+        self.count('loads')
+        try:
+            row = self.connection().execute(
+                'SELECT state FROM sessions WHERE id = ? AND updated > ?',
+                (session_id, time.time() - max_idle_seconds),
+            ).fetchone()
+        except sqlite3.Error:
+            self.count('errors')
+            return None
+
+        if row is None:
+            return None
+        self.count('restored')
+        return json.loads(row[0])
+
+    def save(self, session_id, state):
+        """Write a session's state (a JSON-serializable dict) in one statement"""
+
+        try:
+            self.connection().execute(
+                'INSERT OR REPLACE INTO sessions VALUES (?, ?, ?)',
+                (session_id, json.dumps(state, separators=(',', ':')), time.time()),
+            )
+        except sqlite3.Error:
+            self.count('errors')
+            return
+        self.count('saves')
+
+    def purge(self, max_idle_seconds):
+        """Delete sessions idle longer than max_idle_seconds"""
+
+        try:
+            deleted = self.connection().execute(
+                'DELETE FROM sessions WHERE updated <= ?', (time.time() - max_idle_seconds,)
+            ).rowcount
+        except sqlite3.Error:
+            self.count('errors')
+            return
+        self.count('expired', deleted)
+
+    def summary(self):
+        """This process's counters plus the number of stored sessions"""
+
+        stats = self.counters()
+        try:
+            query = self.connection().execute('SELECT COUNT(*) FROM sessions')
+            stats['stored'] = query.fetchone()[0]
+        except sqlite3.Error:
+            stats['stored'] = 0
+        return stats
+
+STORE = {'instance': None, 'lock': threading.Lock()}
+
+def get_session_store():
+    """The process's SessionStore, or None when HERO_SESSION_STORE is not set"""
+
+    if not STORE_FILE:
+        return None
+    with STORE['lock']:
+        if STORE['instance'] is None:
+            STORE['instance'] = SessionStore(STORE_FILE)
+        return STORE['instance']
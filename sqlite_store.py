@@ -0,0 +1,62 @@
+"""SQLite plumbing shared by the opt-in stores (result_cache.py, session_store.py)
+
+Each store keeps one SQLite file that every worker process on the machine opens. Each thread
+gets its own connection in WAL mode, so readers in every process carry on while one writes.
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+BUSY_TIMEOUT_MS = 5000  # How long a process waits for another one's write lock
+
+class SqliteStore:
+    """Per-thread WAL connections to one SQLite file, plus this process's counters
+
+    Subclasses set SCHEMA (run on every new connection, so it must be idempotent) and STATS
+    (the counter names).
+    """
+
+    SCHEMA = ''
+    STATS = ()
+
+    def __init__(self, path):
+        self.path = path
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.stats = dict.fromkeys(self.STATS, 0)
+
+    def connection(self):
+        """This thread's connection, opened (and the schema created) on first use"""
+
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_MS / 1000, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.executescript(self.SCHEMA)
+            self.local.conn = conn
+        return conn
+
+    @contextmanager
+    def transaction(self):
+        """This thread's connection inside BEGIN IMMEDIATE - committed, or rolled back on error"""
+
+        conn = self.connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+
+    def count(self, stat, amount=1):
+        """Bump one of this process's counters"""
+        with self.lock:
+            self.stats[stat] += amount
+
+    def counters(self):
+        """A copy of this process's counters"""
+        with self.lock:
+            return dict(self.stats)
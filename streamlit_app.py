@@ -1,6 +1,789 @@
+import importlib
+import os
+import sys
+import threading
+import time
+import weakref
+import zlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import numpy as np
 import streamlit as st
-import plotly.graph_objects as go
-from datetime import datetime, timedelta
+import streamlit.components.v1 as components
+
+from calculations import (
+    ANNUAL_HOURS,
+    APPRECIATION_VOLATILITY,
+    BITCOIN_ANNUAL_APPRECIATION,
+    DEFAULT_PURCHASES,
+    FORMULA_CONSTANTS,
+    FORMULAS,
+    INFLATION_RATE,
+    INFLATION_VOLATILITY,
+    MAX_TRAJECTORY_YEARS,
+    MONTE_CARLO_PATHS,
+    POPULATION_PERCENTILES,
+    SENSITIVITY_AXES,
+    TIMELINE_MAX_YEARS,
+    WAGE_POPULATION,
+    WEEKS_PER_PAYCHECK,
+    YEARS,
+    college_work_hours,
+    history_series,
+    history_value,
+    hourly_wage_from_paycheck,
+    lttb_indices,
+    middle_class_timelines,
+    purchase_years_bands,
+    purchasing_power_path,
+    purchasing_power_timeline,
+    run_monte_carlo,
+    savings_trajectory,
+    sensitivity_grid,
+    sensitivity_lookup,
+    sensitivity_slice,
+    time_cost_matrix,
+    wage_distribution,
+    wage_percentile_of,
+)
+import figure_registry
+from instrumentation import (
+    COLLECTORS,
+    EXPORTING,
+    count_figure,
+    instrumented,
+    maybe_export,
+    record_page_run,
+    start_exporters,
+)
+from jobs import JobRejected, JobRunner
+from result_cache import cached_result, get_result_cache
+from session_store import get_session_store, new_session_id, valid_session_id
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access
+    
+    Nothing goes into sys.modules until then, so tools that walk sys.modules (inspect does)
+    don't trigger the import early.
+    """
+    
+    def __init__(self, name):
+        self.name = name
+    
+    def __getattr__(self, attr):
+        return getattr(importlib.import_module(self.name), attr)
+
+# Chart and table libraries load with the first page that uses them - the landing page needs
+# neither (load_chart_modules forces them in once per process)
+go = LazyModule('plotly.graph_objects')
+pio = LazyModule('plotly.io')
+pd = LazyModule('pandas')
+
+# Pillar 1: Broken promises data
+# Hours of work required to buy a house - the real story
+# Baby Boomers: Median household income with 1 earner (~2,080 hours/year)
+# Millennials: Median household income requires 2 earners (~4,160+ hours/year)
+BABY_BOOMERS_HOUSE_HOURS = 7280   # 3.5x income × 2,080 hours (1 earner)
+MILLENNIALS_HOUSE_HOURS = 26208   # 6.3x income × 4,160 hours (2 earners)
+
+# Serialized spec per chart title on the current page, for the ?stats=1 panel - keyed by
+# title so fragment reruns replace their charts' entries instead of appending
+CHART_PAYLOADS = {}
+CHART_LIST_MAX = 32  # Series up to this many points go out as JSON lists (see chart_values)
+CHART_BYTES_BUDGET = 4096  # Serialized spec budget per chart (checked by benchmarks.py)
+
+# Pillar 2: Paycheck input ranges (USD) per pay frequency
+PAYCHECK_LIMITS = {
+    'weekly': (100, 10000),
+    'biweekly': (200, 20000),
+    'monthly': (800, 40000),
+}
+
+# Pillar 2: Purchasing power timeline resolutions (steps per year) and on-screen point density
+TIMELINE_RESOLUTIONS = {'Yearly': 1, 'Monthly': 12, 'Weekly': 52}
+CHART_WIDTH_PX = 704  # Plot width in the centered layout
+TIMELINE_PX_PER_POINT = 5  # One kept point per 5 px keeps both series under CHART_BYTES_BUDGET
+
+# Pillar 4: Sensitivity heatmaps - (y axis, x axis, parameter held at its slider value)
+SENSITIVITY_VIEWS = {
+    'Inflation × Appreciation': ('inflation_rate', 'appreciation_rate', 'years'),
+    'Inflation × Horizon': ('inflation_rate', 'years', 'appreciation_rate'),
+    'Appreciation × Horizon': ('appreciation_rate', 'years', 'inflation_rate'),
+}
+SENSITIVITY_LABELS = {
+    'inflation_rate': ('Fiat Inflation (%/year)', 100),  # (label, display scale)
+    'appreciation_rate': ('Hard Money Appreciation (%/year)', 100),
+    'years': ('Horizon (Years)', 1),
+}
+SENSITIVITY_DISPLAY_STRIDE = {'inflation_rate': 2, 'appreciation_rate': 2, 'years': 2}
+# Fiat wins .. hard money wins
+SENSITIVITY_COLORSCALE = [[0, '#d73027'], [0.5, '#ffffbf'], [1, '#1a9850']]
+
+# Pillar 3: Wealth share snapshots
+WEALTH_YEARS = [1971, 1980, 1990, 2000, 2010, 2020, 2024]
+
+# Per-session memory: a SessionRecord and everything it holds stays under the budget,
+# so 10,000 sessions cost at most ~100 MB on top of Streamlit's own widget state. The
+# measured worst case of a normal journey - a finished 50-year simulation, the workforce
+# comparison, derived values and a full timing history - is 9,867 bytes
+SESSION_BYTE_BUDGET = 10240
+SESSION_NAV_TIMINGS = 20  # Navigation timings kept per session
+SESSION_COMPACT_SECONDS = 10 * 60  # Idle this long: drop timing history and other pages' jobs
+SESSION_EVICT_SECONDS = 60 * 60  # Idle this long: reset to defaults and stop tracking
+SESSION_SWEEP_SECONDS = 60  # Minimum gap between sweeps of idle sessions
+# A job done this soon renders in the run that submitted it. A warm workforce comparison
+# finishes in 0.15 ms (median of 40, max 0.9 ms), so the wait returns at once for it and only
+# slow jobs pay the full 50 ms - less than one progress poll and the app rerun it ends with
+JOB_INLINE_SECONDS = 0.05
+JOB_POLL_SECONDS = 0.5  # How often a page shows a running job's progress
+
+# HERO_PREFETCH=0 stops warming the journey's next page in the background after each page
+PREFETCH = os.environ.get('HERO_PREFETCH', '1') != '0'
+
+# HERO_BROWSER_CALCULATORS=1 evaluates the calculators in the browser from calculations.FORMULAS;
+# their inputs reach the server only when the visitor navigates
+BROWSER_CALCULATORS = os.environ.get('HERO_BROWSER_CALCULATORS') == '1'
+BROWSER_CALCULATOR_PAGES = ('time_has_value', 'same_rules_for_everyone')
+BROWSER_STATE_SLOTS = ('pay_frequency', 'weekly_pay', 'biweekly_pay', 'monthly_pay', 'expense')
+if BROWSER_CALCULATORS:
+    hero_calculators = components.declare_component(
+        'hero_calculators',
+        path=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'components',
+                          'hero_calculators'),
+    )
+
+class SessionRecord:
+    """Everything the journey remembers about one visitor, in fixed slots instead of a dict"""
+    
+    __slots__ = (
+        'pay_frequency', 'weekly_pay', 'biweekly_pay', 'monthly_pay', 'hourly_wage', 'expense',
+        'nav_started', 'nav_timings', 'jobs', 'inputs', 'derived', 'session_id',
+        'saved', 'page', 'last_seen', 'evicted', '__weakref__',
+    )
+    
+    # The compact part an external session store keeps (see session_store.py)
+    PERSISTED = ('pay_frequency', 'weekly_pay', 'biweekly_pay', 'monthly_pay', 'hourly_wage',
+                 'expense')
+    
+    # Widget keys that show persisted slots; dropped with an evicted record so both reset
+    WIDGET_KEYS = ('pay_frequency_main', 'weekly_paycheck_input', 'biweekly_paycheck_input',
+                   'monthly_paycheck_input', 'expense_input_1')
+    
+    def __init__(self):
+        self.reset()
+        self.session_id = None
+        self.last_seen = time.monotonic()
+        self.evicted = False  # Set by the idle sweep; the session then starts a new record
+    
+    def reset(self):
+        """Back to the calculator defaults with no history or jobs (running ones are cancelled)"""
+        for job in getattr(self, 'jobs', {}).values():
+            job.cancel()
+        self.pay_frequency = 'biweekly'
+        self.weekly_pay = 800
+        self.biweekly_pay = 1600
+        self.monthly_pay = 3200
+        self.hourly_wage = None
+        self.expense = 2000
+        self.nav_started = None
+        self.nav_timings = []
+        self.jobs = {}     # job name -> Job (see jobs.py)
+        self.inputs = {}   # input name -> (value, version)
+        self.derived = {}  # derived name -> (upstream versions, value)
+        self.saved = None  # (state, monotonic time) last written to the session store
+        self.page = 'landing'  # Page of the latest script run, whose job results stay
+    
+    def state(self):
+        """The persisted slots as a JSON-ready dict"""
+        return {slot: getattr(self, slot) for slot in self.PERSISTED}
+    
+    def restore(self, state):
+        """Fill the persisted slots from a stored state, ignoring unknown keys"""
+        for slot in self.PERSISTED:
+            if slot in state:
+                setattr(self, slot, state[slot])
+    
+    def compact(self):
+        """Drop what can be recomputed: timing history, and finished jobs of other pages"""
+        self.nav_timings = []
+        self.jobs = {name: job for name, job in self.jobs.items()
+                     if not job.done() or name in PAGES[self.page]['jobs']}
+    
+    def nbytes(self):
+        """Approximate bytes held by this record and its contents"""
+        
+        total = sys.getsizeof(self)
+        for slot in self.__slots__[:-1]:
+            total += sys.getsizeof(getattr(self, slot))
+        
+        total += sum(sys.getsizeof(timing) + sys.getsizeof(timing[0]) + sys.getsizeof(timing[1])
+                     for timing in self.nav_timings)
+        
+        for job in self.jobs.values():
+            total += sum(sys.getsizeof(value) for value in job.inputs.values())
+            if job.done() and not job.future.cancelled() and job.future.exception() is None:
+                total += sum(getattr(value, 'nbytes', sys.getsizeof(value))
+                             for value in job.result().values())
+        
+        for _, value in list(self.inputs.values()) + list(self.derived.values()):
+            total += sum(getattr(part, 'nbytes', sys.getsizeof(part))
+                         for part in (value if isinstance(value, tuple) else (value,)))
+        
+        return total
+
+@st.cache_resource
+def get_simulation_pool():
+    """Process-wide pool for simulation batches (NumPy frees the GIL, so threads use all CPUs)"""
+    return ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="simulation")
+
+@st.cache_resource
+def get_job_runner():
+    """Bounded pool for whole calculations, off the script thread (see jobs.py)"""
+    return JobRunner()
+
+def submit_job(name, func, **inputs):
+    """This session's job for name and inputs, or None (after a notice) if a limit refused it
+    
+    A change of inputs replaces - and cancels - the session's outdated job of that name. Waits
+    up to JOB_INLINE_SECONDS (returning as soon as the job is done), so quick jobs don't cost
+    the visitor a progress poll and an extra rerun.
+    """
+    
+    record = session_record()
+    try:
+        job = get_job_runner().submit(record.jobs, id(record), name, func, **inputs)
+    except JobRejected as err:
+        st.warning(f"⏳ Not started - {err}. Try again in a moment.")
+        return None
+    wait([job.future], timeout=JOB_INLINE_SECONDS)
+    return job
+
+@st.cache_resource(show_spinner=False)
+def get_wage_distribution():
+    """The binned workforce, read from the disk result cache when another worker already built it"""
+    return cached_result('wage_distribution', wage_distribution, population=WAGE_POPULATION, seed=0)
+
+@st.cache_resource
+def get_session_registry():
+    """Process-wide weak set of live session records, for accounting and idle sweeps"""
+    return {'records': weakref.WeakSet(), 'last_sweep': 0.0, 'evicted': 0, 'compacted': 0,
+            'lock': threading.Lock()}
+
+def session_record():
+    """This session's SessionRecord, created and registered on first use or after eviction"""
+    
+    record = st.session_state.get('hero')
+    if record is not None and record.evicted:
+        # Back after an idle eviction: start over at the defaults, in the widgets too
+        for key in SessionRecord.WIDGET_KEYS:
+            st.session_state.pop(key, None)
+        record = None
+    if record is None:
+        record = st.session_state.hero = SessionRecord()
+        restore_session(record)
+        registry = get_session_registry()
+        with registry['lock']:
+            registry['records'].add(record)
+    
+    record.last_seen = time.monotonic()
+    return record
+
+def restore_session(record):
+    """Attach a new session to the external store, picking up a journey another worker saved"""
+    
+    store = get_session_store()
+    if store is None:
+        return
+    
+    session_id = st.query_params.get('sid')
+    state = store.load(session_id, SESSION_EVICT_SECONDS) if valid_session_id(session_id) else None
+    if state is not None:
+        record.restore(state)
+        if 'current_page' not in st.session_state and state.get('current_page') in PAGES:
+            st.session_state.current_page = state['current_page']
+    
+    # Every session writes under a fresh id, even a resumed one: anyone holding a shared URL
+    # can read its inputs, but never overwrite the journey they were copied from
+    record.session_id = new_session_id()
+    # The id rides along in the URL, so a reconnect to any worker finds the same journey
+    st.query_params['sid'] = record.session_id
+
+def persist_session():
+    """Write this session's inputs and page to the external store when they changed"""
+    
+    store = get_session_store()
+    record = session_record()
+    if store is None or record.session_id is None:
+        return
+    
+    state = {**record.state(), 'current_page': st.session_state.get('current_page', 'landing')}
+    now = time.monotonic()
+    # Unchanged states are rewritten once a sweep interval, so stored sessions only expire idle
+    saved_state, saved_at = record.saved or (None, 0.0)
+    if state != saved_state or now - saved_at > SESSION_SWEEP_SECONDS:
+        store.save(record.session_id, state)
+        record.saved = (state, now)
+
+def sweep_sessions():
+    """Compact or evict idle sessions, and compact the current one if it is over budget"""
+    
+    record = session_record()
+    if record.nbytes() > SESSION_BYTE_BUDGET:
+        # Timing history goes first; finished results only if that wasn't enough
+        record.nav_timings = []
+        if record.nbytes() > SESSION_BYTE_BUDGET:
+            record.compact()
+    
+    registry = get_session_registry()
+    now = time.monotonic()
+    
+    with registry['lock']:
+        if now - registry['last_sweep'] < SESSION_SWEEP_SECONDS:
+            return
+        registry['last_sweep'] = now
+        
+        store = get_session_store()
+        if store is not None:
+            store.purge(SESSION_EVICT_SECONDS)
+        
+        for idle_record in list(registry['records']):
+            idle = now - idle_record.last_seen
+            if idle > SESSION_EVICT_SECONDS:
+                idle_record.reset()
+                idle_record.evicted = True
+                registry['records'].discard(idle_record)
+                registry['evicted'] += 1
+            elif idle > SESSION_COMPACT_SECONDS and (idle_record.nav_timings
+                                                     or idle_record.jobs):
+                idle_record.compact()
+                registry['compacted'] += 1
+
+def session_memory_stats():
+    """Live session count and the bytes their records hold"""
+    
+    registry = get_session_registry()
+    
+    with registry['lock']:
+        sizes = [record.nbytes() for record in list(registry['records'])]
+        return {
+            'sessions': len(sizes),
+            'total_bytes': sum(sizes),
+            'max_bytes': max(sizes, default=0),
+            'evicted': registry['evicted'],
+            'compacted': registry['compacted'],
+        }
+
+def major_purchase_costs(hourly_wage):
+    """Hours and years of work for each default purchase at one hourly wage"""
+    hours, years = time_cost_matrix(list(DEFAULT_PURCHASES.values()), [hourly_wage])
+    return hours[:, 0], years[:, 0]
+
+# Derived calculator values: name -> (upstream inputs or derived names, function of them)
+DERIVED = {
+    'hourly_wage': (('paycheck', 'pay_frequency'), lambda paycheck, frequency:
+                    float(hourly_wage_from_paycheck(paycheck, frequency))),
+    'annual_income': (('hourly_wage',), lambda hourly_wage: hourly_wage * ANNUAL_HOURS),
+    'major_purchase_costs': (('hourly_wage',), major_purchase_costs),
+}
+
+@st.cache_resource
+def get_derived_stats():
+    """Process-wide counts of derived values recomputed vs served from a session's memo"""
+    return {'recomputed': Counter(), 'avoided': Counter(), 'lock': threading.Lock()}
+
+def derive(*names, **inputs):
+    """Derived values for this session, each recomputed only when one of its upstream inputs changed
+    
+    Inputs are plain comparable values. Each carries a version that moves only when its value
+    does. A derived value is memoized with the versions it was computed from, so a rerun caused
+    by some other widget reuses it. Returns one value for one name, else a tuple.
+    """
+    
+    record = session_record()
+    for name, value in inputs.items():
+        previous = record.inputs.get(name)
+        if previous is None or previous[0] != value:
+            record.inputs[name] = (value, previous[1] + 1 if previous else 0)
+    
+    stats = get_derived_stats()
+    resolved = {}  # Each name resolves once per call, however many dependents share it
+    
+    def resolve(name):
+        if name in resolved:
+            return resolved[name]
+        if name not in DERIVED:
+            resolved[name] = record.inputs[name]
+            return resolved[name]
+        
+        upstream, func = DERIVED[name]
+        values, versions = zip(*(resolve(dependency) for dependency in upstream))
+        memo = record.derived.get(name)
+        
+        if memo is not None and memo[0] == versions:
+            counter, value = 'avoided', memo[1]
+        else:
+            counter, value = 'recomputed', func(*values)
+            record.derived[name] = (versions, value)
+        
+        # A dependency served from the memo saved nothing the caller would otherwise have paid for
+        if counter == 'recomputed' or name in names:
+            with stats['lock']:
+                stats[counter][name] += 1
+        
+        # A derived value's version is the versions it was computed from
+        resolved[name] = (value, versions)
+        return resolved[name]
+    
+    values = tuple(resolve(name)[0] for name in names)
+    return values[0] if len(values) == 1 else values
+
+def derived_stats():
+    """Recomputed and avoided counts per derived value"""
+    
+    stats = get_derived_stats()
+    with stats['lock']:
+        return {name: {'recomputed': stats['recomputed'][name], 'avoided': stats['avoided'][name]}
+                for name in DERIVED}
+
+def build_static_figure(name):
+    """A static figure and its serialized spec (used to measure the payload), for the registry"""
+    
+    fig = STATIC_FIGURE_BUILDERS[name]()
+    return fig, pio.to_json(fig, validate=False)
+
+def get_static_figure(name):
+    """Return a static figure and its serialized spec, building both only on first use"""
+    return figure_registry.get_entry(name, lambda: build_static_figure(name))
+
+def figure_registry_stats():
+    """Hit/miss counters and payload sizes for the static figure registry"""
+    
+    stats = figure_registry.registry_stats()
+    lookups = stats['hits'] + stats['misses']
+    return {
+        'hits': stats['hits'],
+        'misses': stats['misses'],
+        'hit_rate': stats['hits'] / lookups if lookups else 0.0,
+        'figures': len(stats['entries']),
+        'spec_bytes': {name: len(spec) for name, (_, spec) in stats['entries'].items()},
+    }
+
+@st.cache_resource(show_spinner=False)
+def load_chart_modules():
+    """Import Plotly and pandas and register the chart template, once per process"""
+    
+    # One compact template shared by every chart. Streamlit's default template carries ~3.7 KB
+    # of defaults for trace types we never draw; only its colorway placeholders matter here
+    # (the frontend swaps them for theme colors)
+    import streamlit.elements.plotly_chart  # Registers the 'streamlit' template
+    if 'hero' not in pio.templates:
+        pio.templates['hero'] = go.layout.Template(
+            layout={'colorway': pio.templates['streamlit'].layout.colorway}
+        )
+    pio.templates.default = 'hero'
+    importlib.import_module('pandas')  # Here, not mid-render in some session's thread
+
+@st.cache_resource
+def get_prefetcher():
+    """One background thread that warms the next page's caches while the visitor reads"""
+    return {'pool': ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch"),
+            'warmed': set(), 'completed': 0, 'failed': 0, 'total_ms': 0.0,
+            'lock': threading.Lock()}
+
+def warm_page(page):
+    """Fill the process-wide caches a page reads; returns the milliseconds it took
+    
+    Runs off the script thread, where there is no page to draw a spinner on - the cached
+    functions it reaches are declared with show_spinner=False.
+    """
+    
+    started = time.perf_counter()
+    if PAGES[page]['charts']:
+        load_chart_modules()
+    for name in PAGES[page]['figures']:
+        get_static_figure(name)
+    for load in PAGES[page]['data']:
+        load()
+    return (time.perf_counter() - started) * 1000
+
+def prefetch_next_page(page):
+    """Warm the journey's next page in the background - once per process, not per session"""
+    
+    next_page = PAGES[page]['next']
+    prefetcher = get_prefetcher()
+    with prefetcher['lock']:
+        if next_page is None or next_page in prefetcher['warmed']:
+            return
+        prefetcher['warmed'].add(next_page)
+    
+    def finished(future):
+        with prefetcher['lock']:
+            if future.exception() is None:
+                prefetcher['completed'] += 1
+                prefetcher['total_ms'] += future.result()
+            else:
+                # The page still builds what it needs when it renders; a later run retries
+                prefetcher['warmed'].discard(next_page)
+                prefetcher['failed'] += 1
+    
+    prefetcher['pool'].submit(warm_page, next_page).add_done_callback(finished)
+
+def prefetch_stats():
+    """Pages warmed ahead of the visitor and the background time spent on them"""
+    
+    prefetcher = get_prefetcher()
+    with prefetcher['lock']:
+        return {key: prefetcher[key] for key in ('completed', 'failed', 'total_ms')}
+
+def warm_up():
+    """Load every page's libraries, figures and data before visitors reach them (serve.py)"""
+    
+    for page in PAGES:
+        warm_page(page)
+
+def chart_values(values):
+    """Chart-precision copy of a series: short ones as plain lists, long ones as float32 arrays"""
+    
+    # Plotly base64-encodes arrays; for a handful of points the JSON list is shorter
+    values = np.asarray(values, dtype=np.float32)
+    if values.size <= CHART_LIST_MAX:
+        return [float(f"{value:.6g}") for value in values]
+    return values
+
+def render_chart(fig, spec=None):
+    """Send a Plotly figure to the browser - the one place every chart goes through
+    
+    Streamlit serializes every figure it sends. Payload sizes are measured only for the
+    ?stats=1 panel or a metrics exporter, reusing the spec cached with a static figure so the
+    measurement does not add a second serialization.
+    """
+    
+    show_stats = st.query_params.get('stats') == '1'
+    if EXPORTING or show_stats:
+        spec = spec or pio.to_json(fig, validate=False)
+        if show_stats:
+            CHART_PAYLOADS[fig.layout.title.text or 'Untitled'] = spec
+        count_figure(len(spec))
+    else:
+        count_figure()
+    st.plotly_chart(fig, use_container_width=True)
+
+def app_metrics():
+    """Figure cache, navigation, session and result cache counters for the metrics exporter"""
+    
+    cache = figure_registry_stats()
+    prefetch = prefetch_stats()
+    jobs = get_job_runner().summary()
+    nav = get_navigation_stats()
+    sessions = session_memory_stats()
+    derived = derived_stats().values()
+    metrics = {
+        'hero_figure_cache_hits': cache['hits'],
+        'hero_figure_cache_misses': cache['misses'],
+        'hero_prefetched_pages': prefetch['completed'],
+        'hero_prefetch_failures': prefetch['failed'],
+        'hero_prefetch_seconds': prefetch['total_ms'] / 1000,
+        'hero_navigations': nav['navigations'],
+        'hero_navigation_seconds': nav['total_ms'] / 1000,
+        'hero_sessions': sessions['sessions'],
+        'hero_session_bytes': sessions['total_bytes'],
+        'hero_sessions_evicted': sessions['evicted'],
+        'hero_derived_recomputed': sum(counts['recomputed'] for counts in derived),
+        'hero_derived_avoided': sum(counts['avoided'] for counts in derived),
+        'hero_jobs_active': jobs['active'],
+        'hero_jobs_completed': jobs['completed'],
+        'hero_jobs_cancelled': jobs['cancelled'],
+        'hero_jobs_rejected': jobs['rejected'],
+    }
+    
+    result_cache = get_result_cache()
+    if result_cache is not None:
+        cached = result_cache.summary()
+        metrics.update({
+            'hero_result_cache_hits': cached['hits'],
+            'hero_result_cache_misses': cached['misses'],
+            'hero_result_cache_evictions': cached['evictions'],
+            'hero_result_cache_bytes': cached['bytes'],
+        })
+    
+    store = get_session_store()
+    if store is not None:
+        stored = store.summary()
+        metrics.update({
+            'hero_session_store_sessions': stored['stored'],
+            'hero_session_store_restored': stored['restored'],
+            'hero_session_store_saves': stored['saves'],
+        })
+    return metrics
+
+@st.cache_resource
+def get_navigation_stats():
+    """Process-wide page change timings (one script run per navigation)"""
+    return {'navigations': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'lock': threading.Lock()}
+
+def go_to_page(page):
+    """Button callback: switch pages before the script runs, so no st.rerun() is needed"""
+    st.session_state.current_page = page
+    session_record().nav_started = time.perf_counter()
+
+def record_navigation_timing():
+    """Record how long the script run that rendered a newly selected page took"""
+    
+    record = session_record()
+    started, record.nav_started = record.nav_started, None
+    if started is None:
+        return
+    
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    
+    # Last few navigations for this session
+    record.nav_timings.append((st.session_state.current_page, elapsed_ms))
+    del record.nav_timings[:-SESSION_NAV_TIMINGS]
+    
+    stats = get_navigation_stats()
+    with stats['lock']:
+        stats['navigations'] += 1
+        stats['total_ms'] += elapsed_ms
+        stats['max_ms'] = max(stats['max_ms'], elapsed_ms)
+
+def sync_browser_calculator():
+    """Browser calculator navigation callback: keep the inputs it sends, then switch pages"""
+    
+    value = st.session_state[f"browser_navigation_{st.session_state.current_page}"]
+    state = value.get('state', {})
+    record = session_record()
+    
+    # Inputs come from the browser, so only in-range numbers are kept
+    if state.get('pay_frequency') in PAYCHECK_LIMITS:
+        record.pay_frequency = state['pay_frequency']
+    for frequency, (low, high) in PAYCHECK_LIMITS.items():
+        pay = state.get(f"{frequency}_pay")
+        if isinstance(pay, (int, float)):
+            setattr(record, f"{frequency}_pay", int(min(max(pay, low), high)))
+    if isinstance(state.get('expense'), (int, float)) and state['expense'] >= 1:
+        record.expense = int(state['expense'])
+    
+    paycheck = getattr(record, f"{record.pay_frequency}_pay")
+    record.hourly_wage = float(hourly_wage_from_paycheck(paycheck, record.pay_frequency))
+    
+    if value.get('page') in PAGES:
+        go_to_page(value['page'])
+
+def render_browser_calculator(calculator, **args):
+    """One hero_calculators component frame; it evaluates calculations.FORMULAS client-side"""
+    
+    record = session_record()
+    return hero_calculators(
+        calculator=calculator,
+        formulas=FORMULAS,
+        constants=FORMULA_CONSTANTS,
+        state={slot: getattr(record, slot) for slot in BROWSER_STATE_SLOTS},
+        **args
+    )
+
+def render_navigation(back_label=None, next_label=None):
+    """Back/next buttons for the current page's links in PAGES"""
+    
+    page = PAGES[st.session_state.current_page]
+    
+    # Browser calculators hand their inputs over with the navigation click
+    if BROWSER_CALCULATORS and st.session_state.current_page in BROWSER_CALCULATOR_PAGES:
+        render_browser_calculator(
+            'navigation',
+            back=page['prev'], back_label=back_label, next=page['next'], next_label=next_label,
+            key=f"browser_navigation_{st.session_state.current_page}",
+            on_change=sync_browser_calculator,
+        )
+        return
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if back_label:
+            st.button(back_label, type="secondary", on_click=go_to_page, args=(page['prev'],))
+    
+    with col2:
+        if next_label:
+            st.button(next_label, type="primary", on_click=go_to_page, args=(page['next'],))
+
+def render_stats_panel():
+    """Show cache and navigation counters when the page is opened with ?stats=1"""
+    
+    if st.query_params.get('stats') != '1':
+        return
+    
+    stats = figure_registry_stats()
+    with st.expander("Figure cache stats"):
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Hits", f"{stats['hits']:,}")
+        col2.metric("Misses", f"{stats['misses']:,}")
+        col3.metric("Hit Rate", f"{stats['hit_rate']:.1%}")
+        prefetch = prefetch_stats()
+        st.markdown(f"Prefetched {prefetch['completed']:,} pages in the background "
+                    f"({prefetch['total_ms']:,.0f} ms), {prefetch['failed']:,} failed.")
+        st.json(stats['spec_bytes'])
+    
+    with st.expander("Chart payloads"):
+        for title, spec in CHART_PAYLOADS.items():
+            compressed = len(zlib.compress(spec.encode()))
+            over = " - over budget" if len(spec) > CHART_BYTES_BUDGET else ""
+            st.markdown(f"`{title}`: {len(spec):,} bytes ({compressed:,} compressed){over}")
+    
+    nav = get_navigation_stats()
+    with st.expander("Navigation timing"):
+        average_ms = nav['total_ms'] / nav['navigations'] if nav['navigations'] else 0.0
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Navigations", f"{nav['navigations']:,}")
+        col2.metric("Average", f"{average_ms:.0f} ms")
+        col3.metric("Slowest", f"{nav['max_ms']:.0f} ms")
+        for page, elapsed_ms in session_record().nav_timings:
+            st.markdown(f"`{page}`: {elapsed_ms:.0f} ms")
+    
+    sessions = session_memory_stats()
+    with st.expander("Session memory"):
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Sessions", f"{sessions['sessions']:,}")
+        col2.metric("Total", f"{sessions['total_bytes'] / 1024:,.1f} KiB")
+        col3.metric("Largest", f"{sessions['max_bytes']:,} B", f"budget {SESSION_BYTE_BUDGET:,} B",
+                    delta_color="off")
+        st.markdown(f"Compacted {sessions['compacted']:,} idle sessions, "
+                    f"evicted {sessions['evicted']:,}.")
+        store = get_session_store()
+        if store is not None:
+            stored = store.summary()
+            st.markdown(f"Session store: {stored['stored']:,} journeys stored, "
+                        f"{stored['restored']:,} resumed here, {stored['saves']:,} saves, "
+                        f"{stored['errors']:,} errors.")
+    
+    result_cache = get_result_cache()
+    if result_cache is not None:
+        with st.expander("Result cache"):
+            stats = result_cache.summary()
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Hit rate", f"{stats['hit_rate']:.0%}",
+                        f"{stats['hits']:,} hits this process", delta_color="off")
+            col2.metric("Entries", f"{stats['entries']:,}", f"{stats['evictions']:,} evicted here",
+                        delta_color="off")
+            col3.metric("Stored", f"{stats['bytes'] / 1024:,.1f} KiB",
+                        f"budget {result_cache.max_bytes / 1024 ** 2:,.0f} MiB", delta_color="off")
+    
+    runner = get_job_runner()
+    with st.expander("Background jobs"):
+        jobs = runner.summary()
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Active", f"{jobs['active']:,}", f"{runner.workers} workers", delta_color="off")
+        col2.metric("Completed", f"{jobs['completed']:,}", f"{jobs['failed']:,} failed",
+                    delta_color="off")
+        col3.metric("Cancelled", f"{jobs['cancelled']:,}", f"{jobs['rejected']:,} refused",
+                    delta_color="off")
+        st.markdown(f"Limits: {runner.session_limit} per session, {runner.limit} per process.")
+    
+    with st.expander("Derived values"):
+        st.dataframe(
+            pd.DataFrame.from_dict(derived_stats(), orient='index'),
+            use_container_width=True,
+        )
 
 def main():
     """Main function to route to different pages"""
@@ -21,29 +804,38 @@ def main():
     </style>
     """, unsafe_allow_html=True)
     
-    # Initialize navigation if needed
+    # A new session may resume a journey from the external session store (see session_store.py)
+    session_record()
+    CHART_PAYLOADS.clear()
+    
+    # Initialize navigation if needed - ?page= lets static exports hydrate into a calculator
     if 'current_page' not in st.session_state:
-        st.session_state.current_page = 'landing'
+        st.session_state.current_page = st.query_params.get('page', 'landing')
+    
+    # Metrics endpoint/profiler are opt-in (see instrumentation.py)
+    start_exporters()
+    COLLECTORS['app'] = app_metrics
     
     # Route to appropriate page
-    if st.session_state.current_page == 'landing':
-        render_landing_page()
-    elif st.session_state.current_page == 'question_everything':
-        render_question_everything()
-    elif st.session_state.current_page == 'time_has_value':
-        render_time_has_value()
-    elif st.session_state.current_page == 'hero_seeks_understanding':
-        render_hero_seeks_understanding()
-    elif st.session_state.current_page == 'same_rules_for_everyone':
-        render_same_rules_for_everyone()
-    elif st.session_state.current_page == 'bitcoin_revelation':
-        st.success("🚧 Coming soon: The solution that changes everything")
-        # Will implement bitcoin_revelation next
-    elif st.session_state.current_page == 'heros_triumph':
-        render_heros_triumph()
-    else:
+    page = PAGES.get(st.session_state.current_page)
+    if page is None:
         st.error("Invalid page")
+    else:
+        record_page_run(st.session_state.current_page)
+        session_record().page = st.session_state.current_page
+        if page['charts']:
+            load_chart_modules()
+        page['render']()
+        if PREFETCH:
+            prefetch_next_page(st.session_state.current_page)
+    
+    record_navigation_timing()
+    sweep_sessions()
+    persist_session()
+    render_stats_panel()
+    maybe_export()
 
+@instrumented
 def render_landing_page():
     """Render the simple landing page"""
     
@@ -71,10 +863,10 @@ def render_landing_page():
     col1, col2, col3 = st.columns([1, 2, 1])
     
     with col2:
-        if st.button("Take the Hero's Journey", type="primary", use_container_width=True):
-            st.session_state.current_page = 'question_everything'
-            st.rerun()
+        st.button("Take the Hero's Journey", type="primary", use_container_width=True,
+                  on_click=go_to_page, args=(PAGES['landing']['next'],))
 
+@instrumented
 def render_question_everything():
     """Render the Question Everything page - Pillar 1"""
     
@@ -117,18 +909,9 @@ def render_question_everything():
     """)
     
     # Navigation
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        if st.button("← Back", type="secondary"):
-            st.session_state.current_page = 'landing'
-            st.rerun()
-    
-    with col2:
-        if st.button("Your Time Has Value →", type="primary"):
-            st.session_state.current_page = 'time_has_value'
-            st.rerun()
+    render_navigation("← Back", "Your Time Has Value →")
 
+@instrumented
 def render_broken_promises():
     """Show the three broken promises of the life script"""
     
@@ -144,40 +927,16 @@ def render_broken_promises():
     with tab3:
         render_family_crisis()
 
+@instrumented
 def render_college_crisis():
     """Show the college affordability crisis"""
     
     st.markdown("### Promise #1: Go to College")
     
-    # College and minimum wage data
-    college_1985 = 3800  # Average annual tuition 1985
-    college_2022 = 38000  # Average annual tuition 2022
-    min_wage_1985 = 3.35  # Federal minimum wage 1985
-    min_wage_2022 = 7.25  # Federal minimum wage 2022
-    
     # Calculate hours needed to work
-    hours_1985 = college_1985 / min_wage_1985
-    hours_2022 = college_2022 / min_wage_2022
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Bar(
-        name='Hours at Minimum Wage (Annual)',
-        x=['1985', '2022'],
-        y=[hours_1985, hours_2022],
-        marker_color=['lightblue', 'darkblue'],
-        text=[f'{hours_1985:,.0f} hours', f'{hours_2022:,.0f} hours'],
-        textposition='auto',
-    ))
+    hours_1985, hours_2022 = college_work_hours()
     
-    fig.update_layout(
-        title='Hours of Work Needed for One Year of College',
-        yaxis_title='Hours of Work Required',
-        height=350,
-        showlegend=False
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+    render_chart(*get_static_figure('college_crisis'))
     
     # Show the devastating comparison
     col1, col2 = st.columns(2)
@@ -195,48 +954,49 @@ def render_college_crisis():
     
     *There aren't enough hours in the week.*
     """)
+
+def build_college_crisis_figure():
+    """Build the hours-for-college bar chart"""
     
-def render_housing_crisis():
-    """Show the housing affordability crisis"""
-    
-    st.markdown("### Promise #2: Buy a House")
-    
-    # Hours of work required to buy a house - the real story
-    # Baby Boomers: Median household income with 1 earner (~2,080 hours/year)
-    # Millennials: Median household income requires 2 earners (~4,160+ hours/year)
-    
-    baby_boomers_house_hours = 7280   # 3.5x income × 2,080 hours (1 earner) 
-    millennials_house_hours = 26208   # 6.3x income × 4,160 hours (2 earners)
+    hours_1985, hours_2022 = college_work_hours()
     
     fig = go.Figure()
     
     fig.add_trace(go.Bar(
-        name='Hours of Work Required to Buy Median House',
-        x=['Baby Boomers (1985)', 'Millennials (2022)'],
-        y=[baby_boomers_house_hours, millennials_house_hours],
-        marker_color=['lightcoral', 'darkred'],
-        text=[f'{baby_boomers_house_hours:,} hours', f'{millennials_house_hours:,} hours'],
+        name='Hours at Minimum Wage (Annual)',
+        x=['1985', '2022'],
+        y=[hours_1985, hours_2022],
+        marker_color=['lightblue', 'darkblue'],
+        text=[f'{hours_1985:,.0f} hours', f'{hours_2022:,.0f} hours'],
         textposition='auto',
     ))
     
     fig.update_layout(
-        title='Millennials Must Work 3.6x More Hours for the Same House',
-        yaxis_title='Hours of Human Labor Required',
+        title='Hours of Work Needed for One Year of College',
+        yaxis_title='Hours of Work Required',
         height=350,
         showlegend=False
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
+
+@instrumented
+def render_housing_crisis():
+    """Show the housing affordability crisis"""
+    
+    st.markdown("### Promise #2: Buy a House")
+    
+    render_chart(*get_static_figure('housing_crisis'))
     
     # Show the devastating time comparison
     col1, col2 = st.columns(2)
     
     with col1:
-        boomer_years = baby_boomers_house_hours / 2080  # Full-time years
+        boomer_years = BABY_BOOMERS_HOUSE_HOURS / 2080  # Full-time years
         st.metric("Baby Boomers", f"{boomer_years:.1f} years", "One person working full-time")
     
     with col2:
-        millennial_years = millennials_house_hours / 2080  # Full-time years 
+        millennial_years = MILLENNIALS_HOUSE_HOURS / 2080  # Full-time years 
         st.metric("Millennials", f"{millennial_years:.1f} years", "Of full-time labor required")
     
     st.markdown("---")
@@ -247,46 +1007,50 @@ def render_housing_crisis():
     **Houses didn't get better. Your work ethic didn't get worse. The money itself changed.**
     """)
 
-def render_family_crisis():
-    """Show the family affordability crisis"""
-    
-    st.markdown("### Promise #3: Have a Family")
-    
-    # The death of 9-to-5 and family life
-    multiple_jobs_1994 = 7.5  # Million Americans working multiple jobs (historical baseline)
-    multiple_jobs_2024 = 8.9  # Million Americans working multiple jobs (record high)
-    
-    living_with_parents_1980 = 29  # % of young adults living with parents
-    living_with_parents_2020 = 52  # % of young adults living with parents
+def build_housing_crisis_figure():
+    """Build the hours-for-a-house bar chart"""
     
     fig = go.Figure()
     
-    # Show young adults can't leave home
     fig.add_trace(go.Bar(
-        name='Young Adults Living with Parents',
-        x=['1980', '2020'],
-        y=[living_with_parents_1980, living_with_parents_2020],
-        marker_color=['lightblue', 'darkblue'],
-        text=[f'{living_with_parents_1980}%', f'{living_with_parents_2020}%'],
+        name='Hours of Work Required to Buy Median House',
+        x=['Baby Boomers (1985)', 'Millennials (2022)'],
+        y=[BABY_BOOMERS_HOUSE_HOURS, MILLENNIALS_HOUSE_HOURS],
+        marker_color=['lightcoral', 'darkred'],
+        text=[f'{BABY_BOOMERS_HOUSE_HOURS:,} hours', f'{MILLENNIALS_HOUSE_HOURS:,} hours'],
         textposition='auto',
     ))
     
     fig.update_layout(
-        title='Young Adults Can\'t Afford to Leave Home',
-        yaxis_title='Percentage Living with Parents',
+        title='Millennials Must Work 3.6x More Hours for the Same House',
+        yaxis_title='Hours of Human Labor Required',
         height=350,
         showlegend=False
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
+
+@instrumented
+def render_family_crisis():
+    """Show the family affordability crisis"""
+    
+    st.markdown("### Promise #3: Have a Family")
+    
+    # The death of 9-to-5 and family life
+    multiple_jobs_2024 = history_value('multiple_jobs_millions', 2024)  # Record high
+    living_with_parents_1980 = history_value('living_with_parents_pct', 1980)
+    living_with_parents_2020 = history_value('living_with_parents_pct', 2020)
+    
+    # Show young adults can't leave home
+    render_chart(*get_static_figure('family_crisis'))
     
     # Show the devastating comparison
     col1, col2 = st.columns(2)
     with col1:
-        st.metric("1980", f"{living_with_parents_1980}%", "Normal rate - kids could launch")
+        st.metric("1980", f"{living_with_parents_1980:.0f}%", "Normal rate - kids could launch")
     
     with col2:
-        st.metric("2020", f"{living_with_parents_2020}%", "Great Depression levels")
+        st.metric("2020", f"{living_with_parents_2020:.0f}%", "Great Depression levels")
     
     # Add the death of 9-to-5
     st.markdown("### The Death of \"Working 9 to 5\"")
@@ -310,8 +1074,8 @@ def render_family_crisis():
     st.markdown("### Families Can't Afford to Have Families")
     
     # Birth rate data showing the collapse
-    birth_rate_1957 = 122.9  # Births per 1,000 women 15-44 (baby boom peak)
-    birth_rate_2023 = 54.5   # Current rate - less than half of 1957
+    birth_rate_1957 = history_value('birth_rate', 1957)  # Baby boom peak
+    birth_rate_2023 = history_value('birth_rate', 2023)  # Less than half of 1957
     
     col1, col2 = st.columns(2)
     with col1:
@@ -325,9 +1089,34 @@ def render_family_crisis():
     
     **15% of women ages 40-44 are now childless** - many wanted children but couldn't afford them in time.
     """)
+
+def build_family_crisis_figure():
+    """Build the young-adults-living-with-parents bar chart"""
+    
+    living_with_parents = history_series('living_with_parents_pct', [1980, 2020])
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Bar(
+        name='Young Adults Living with Parents',
+        x=['1980', '2020'],
+        y=chart_values(living_with_parents),
+        marker_color=['lightblue', 'darkblue'],
+        text=[f'{pct:.0f}%' for pct in living_with_parents],
+        textposition='auto',
+    ))
+    
+    fig.update_layout(
+        title='Young Adults Can\'t Afford to Leave Home',
+        yaxis_title='Percentage Living with Parents',
+        height=350,
+        showlegend=False
+    )
     
+    return fig
 
 
+@instrumented
 def render_time_has_value():
     """Render Pillar 2: Your Time Has Value"""
     
@@ -346,7 +1135,17 @@ def render_time_has_value():
     st.markdown("---")
     
     # Personal time-value calculator
-    render_personal_time_calculator()
+    if BROWSER_CALCULATORS:
+        render_browser_calculator(
+            'time_cost',
+            weeks_per_paycheck=WEEKS_PER_PAYCHECK,
+            paycheck_limits=PAYCHECK_LIMITS,
+            purchases=DEFAULT_PURCHASES,
+            annual_hours=ANNUAL_HOURS,
+            key="browser_time_cost",
+        )
+    else:
+        render_personal_time_calculator()
     
     st.markdown("---")
     
@@ -363,26 +1162,16 @@ def render_time_has_value():
     """)
     
     # Navigation
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        if st.button("← Question Everything", type="secondary"):
-            st.session_state.current_page = 'question_everything'
-            st.rerun()
-    
-    with col2:
-        if st.button("Seek Understanding →", type="primary"):
-            st.session_state.current_page = 'hero_seeks_understanding'
-            st.rerun()
+    render_navigation("← Question Everything", "Seek Understanding →")
 
+@st.fragment
+@instrumented
 def render_personal_time_calculator():
-    """Personal time-value calculator"""
+    """Personal time-value calculator, rerun in isolation from the page"""
     
     st.markdown("## Calculate Your Real Time-Cost")
     
-    # Initialize user data if not exists
-    if 'user_data' not in st.session_state:
-        st.session_state.user_data = {}
+    record = session_record()
     
     # Get user's wage information
     col1, col2 = st.columns(2)
@@ -394,57 +1183,64 @@ def render_personal_time_calculator():
         pay_frequency = st.selectbox(
             "How often do you get paid?",
             options=["Bi-weekly (every 2 weeks)", "Weekly", "Monthly"],
-            index=0,  # Default to bi-weekly
+            # The record's frequency, so a journey resumed from the session store keeps it
+            index=['biweekly', 'weekly', 'monthly'].index(record.pay_frequency),
             help="Choose how often you receive your paycheck",
             key="pay_frequency_main"
         )
         
-        # Paycheck amount input
-        if pay_frequency == "Weekly":
-            paycheck_amount = st.number_input(
-                "What's your weekly take-home pay? (USD)", 
-                min_value=100, 
-                max_value=10000, 
-                value=st.session_state.user_data.get('weekly_pay', 800),
-                help="Enter your actual weekly paycheck amount after taxes in US dollars",
-                key="weekly_paycheck_input"
-            )
-            st.session_state.user_data['weekly_pay'] = paycheck_amount
-            weekly_pay = paycheck_amount
-            
-        elif pay_frequency == "Bi-weekly (every 2 weeks)":
-            paycheck_amount = st.number_input(
-                "What's your bi-weekly take-home pay? (USD)", 
-                min_value=200, 
-                max_value=20000, 
-                value=st.session_state.user_data.get('biweekly_pay', 1600),
-                help="Enter your actual bi-weekly paycheck amount after taxes in US dollars",
-                key="biweekly_paycheck_input"
-            )
-            st.session_state.user_data['biweekly_pay'] = paycheck_amount
-            weekly_pay = paycheck_amount / 2
+        # Enter submits the paycheck, so typing doesn't rerun per keystroke
+        with st.form("paycheck_form", border=False):
+            # Paycheck amount input
+            if pay_frequency == "Weekly":
+                paycheck_amount = st.number_input(
+                    "What's your weekly take-home pay? (USD)", 
+                    min_value=PAYCHECK_LIMITS['weekly'][0], 
+                    max_value=PAYCHECK_LIMITS['weekly'][1], 
+                    value=record.weekly_pay,
+                    help="Enter your actual weekly paycheck amount after taxes in US dollars",
+                    key="weekly_paycheck_input"
+                )
+                record.weekly_pay = paycheck_amount
+                frequency = 'weekly'
+                
+            elif pay_frequency == "Bi-weekly (every 2 weeks)":
+                paycheck_amount = st.number_input(
+                    "What's your bi-weekly take-home pay? (USD)", 
+                    min_value=PAYCHECK_LIMITS['biweekly'][0], 
+                    max_value=PAYCHECK_LIMITS['biweekly'][1], 
+                    value=record.biweekly_pay,
+                    help="Enter your actual bi-weekly paycheck amount after taxes in US dollars",
+                    key="biweekly_paycheck_input"
+                )
+                record.biweekly_pay = paycheck_amount
+                frequency = 'biweekly'
+                
+            else:  # Monthly
+                paycheck_amount = st.number_input(
+                    "What's your monthly take-home pay? (USD)", 
+                    min_value=PAYCHECK_LIMITS['monthly'][0], 
+                    max_value=PAYCHECK_LIMITS['monthly'][1], 
+                    value=record.monthly_pay,
+                    help="Enter your actual monthly paycheck amount after taxes in US dollars",
+                    key="monthly_paycheck_input"
+                )
+                record.monthly_pay = paycheck_amount
+                frequency = 'monthly'
             
-        else:  # Monthly
-            paycheck_amount = st.number_input(
-                "What's your monthly take-home pay? (USD)", 
-                min_value=800, 
-                max_value=40000, 
-                value=st.session_state.user_data.get('monthly_pay', 3200),
-                help="Enter your actual monthly paycheck amount after taxes in US dollars",
-                key="monthly_paycheck_input"
-            )
-            st.session_state.user_data['monthly_pay'] = paycheck_amount
-            weekly_pay = paycheck_amount / 4.33  # Average weeks per month
+            st.form_submit_button("Calculate")
         
-        # Calculate hourly wage assuming 40 hours/week
-        hourly_wage = weekly_pay / 40
+        # Hourly wage assuming 40 hours/week; reruns from other widgets reuse the memoized values
+        hourly_wage, annual_income, (hours, years) = derive(
+            'hourly_wage', 'annual_income', 'major_purchase_costs',
+            paycheck=paycheck_amount, pay_frequency=frequency,
+        )
+        record.pay_frequency = frequency
         
         # Store calculated hourly wage
-        st.session_state.user_data['hourly_wage'] = hourly_wage
+        record.hourly_wage = hourly_wage
         
-        # Calculate annual values
-        annual_hours = 40 * 52  # 40 hours/week * 52 weeks
-        annual_income = hourly_wage * annual_hours
+        annual_hours = ANNUAL_HOURS  # 40 hours/week * 52 weeks
         
         st.metric("Your Effective Hourly Rate", f"${hourly_wage:.2f}/hour", "After taxes, 40 hours/week")
         st.metric("Annual Take-Home", f"${annual_income:,.0f}", f"Working {annual_hours:,} hours/year")
@@ -452,21 +1248,140 @@ def render_personal_time_calculator():
     with col2:
         st.markdown("### Major Purchase Time-Costs")
         
-        # Major purchases and their time costs
-        median_house = 400000
-        new_car = 35000
-        college_degree = 40000
-        
-        house_hours = median_house / hourly_wage
-        car_hours = new_car / hourly_wage
-        college_hours = college_degree / hourly_wage
-        
-        # Display as time costs
-        st.metric("Median House", f"{house_hours/annual_hours:.1f} years", f"{house_hours:,.0f} hours of your life")
-        st.metric("New Car", f"{car_hours/annual_hours:.1f} years", f"{car_hours:,.0f} hours of your life")
-        st.metric("College Degree", f"{college_hours/annual_hours:.1f} years", f"{college_hours:,.0f} hours of your life")
-  
-  
+        # Display major purchases as time costs
+        for name, item_hours, item_years in zip(DEFAULT_PURCHASES, hours, years):
+            st.metric(name, f"{item_years:.1f} years", f"{item_hours:,.0f} hours of your life")
+    
+    render_purchase_list(hourly_wage)
+    
+    render_wage_population()
+    
+    # Fragment reruns skip main(), so inputs changed here are saved here
+    persist_session()
+
+@instrumented
+def render_purchase_list(hourly_wage):
+    """Editable purchase list converted to hours and years of work"""
+    
+    st.markdown("### Your Purchase List")
+    st.markdown("*Add anything you're saving for and see what it really costs.*")
+    
+    purchases = st.data_editor(
+        pd.DataFrame({
+            'Purchase': list(DEFAULT_PURCHASES),
+            'Price (USD)': list(DEFAULT_PURCHASES.values()),
+        }),
+        num_rows="dynamic",
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            'Price (USD)': st.column_config.NumberColumn(min_value=0, format="$%d"),
+        },
+        key="purchase_list_editor"
+    )
+    
+    prices = purchases['Price (USD)'].fillna(0).to_numpy()
+    hours, years = time_cost_matrix(prices, [hourly_wage])
+    
+    st.dataframe(
+        purchases.assign(**{'Hours of Your Life': hours[:, 0], 'Years of Work': years[:, 0]}),
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            'Price (USD)': st.column_config.NumberColumn(format="$%d"),
+            'Hours of Your Life': st.column_config.NumberColumn(format="%.0f"),
+            'Years of Work': st.column_config.NumberColumn(format="%.1f"),
+        }
+    )
+
+def workforce_comparison(hourly_wage, progress):
+    """Population years-of-labor bands for the default purchases, and one wage's percentile"""
+    
+    distribution = get_wage_distribution()
+    progress(1, 2)
+    return {
+        'bands': purchase_years_bands(list(DEFAULT_PURCHASES.values()), POPULATION_PERCENTILES,
+                                      distribution),
+        'percentile': float(wage_percentile_of(hourly_wage, distribution)),
+    }
+
+@instrumented
+def render_wage_population():
+    """Years of labor for each major purchase across a 10M-worker wage distribution, and yours"""
+    
+    st.markdown("### Compared to Everyone Else")
+    
+    # Runs off the script thread - on a cold worker it first builds the 10M-worker distribution
+    hourly_wage, (_, your_years) = derive('hourly_wage', 'major_purchase_costs')
+    job = submit_job('workforce', workforce_comparison, hourly_wage=hourly_wage)
+    if job is None:
+        return
+    render_job(job, f"⏳ Comparing with {WAGE_POPULATION:,} workers...",
+               lambda job: render_wage_comparison(job, your_years))
+
+def render_wage_comparison(job, your_years):
+    """The finished workforce comparison: percentile bands per purchase, with you marked"""
+    
+    try:
+        comparison = job.result()
+    except Exception as err:
+        st.error(f"Workforce comparison failed - a hero adapts: {err}")
+        return
+    
+    names = list(DEFAULT_PURCHASES)
+    # p10, p25, p50, p75 and p90 years of labor per purchase
+    low, lower_mid, median, upper_mid, high = comparison['bands'].T
+    percentile = comparison['percentile']
+    
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        name='Middle 80% of Workers',
+        y=names,
+        base=chart_values(low),
+        x=chart_values(high - low),
+        orientation='h',
+        marker_color='rgba(37, 99, 235, 0.2)',
+    ))
+    fig.add_trace(go.Bar(
+        name='Middle 50% of Workers',
+        y=names,
+        base=chart_values(lower_mid),
+        x=chart_values(upper_mid - lower_mid),
+        orientation='h',
+        marker_color='rgba(37, 99, 235, 0.45)',
+    ))
+    fig.add_trace(go.Scatter(
+        name='Median Worker',
+        y=names,
+        x=chart_values(median),
+        mode='markers',
+        marker=dict(color='#2563eb', size=16, symbol='line-ns-open', line=dict(width=3)),
+    ))
+    fig.add_trace(go.Scatter(
+        name='You',
+        y=names,
+        x=chart_values(your_years),
+        mode='markers',
+        marker=dict(color='#f7931a', size=14, symbol='diamond'),
+    ))
+    fig.update_layout(
+        title='Years of Labor Across the Workforce',
+        xaxis_title='Years of Work (log scale)',
+        xaxis_type='log',
+        barmode='overlay',
+        height=350,
+        showlegend=True
+    )
+    render_chart(fig)
+    
+    st.markdown(f"""
+    Your hourly rate beats **{percentile:.0f}%** of {WAGE_POPULATION:,} simulated
+    workers. The median worker needs **{median[0]:.1f} years** of labor for a median house.
+    
+    *Workforce wages are before tax, so your take-home rate is the tougher comparison.*
+    """)
+
+@instrumented
 def render_purchasing_power_theft():
     """Show how purchasing power is systematically stolen"""
     
@@ -485,9 +1400,7 @@ def render_purchasing_power_theft():
         """)
         
         # 1970 calculation: median income $9,870, median house $23,400
-        income_1970 = 9870
-        house_1970 = 23400
-        years_1970 = house_1970 / income_1970
+        years_1970, total_timeline_2024 = middle_class_timelines()
         
         st.metric("Total Timeline", f"{years_1970:.1f} years", "High school → house → family")
         
@@ -501,24 +1414,83 @@ def render_purchasing_power_theft():
         """)
         
         # 2024 calculation: median household income $70,000, median house $490,000
-        household_income_2024 = 70000
-        house_2024 = 490000
-        daycare_annual = 15000  # Per child
-        college_cost = 40000    # Average debt
-        
-        # Timeline: 4 years college + house cost + 5 years daycare for 2 kids
-        house_years_2024 = house_2024 / household_income_2024
-        daycare_years = (daycare_annual * 2 * 5) / household_income_2024  # 2 kids, 5 years each
-        college_years = 4
-        total_timeline_2024 = college_years + house_years_2024 + daycare_years
-        
         st.metric("Total Timeline", f"{total_timeline_2024:.1f} years", "College → house → daycare costs")
     
     # The devastating comparison chart
+    render_chart(*get_static_figure('purchasing_power_theft'))
+    
+    st.markdown(f"""
+    **1970**: 2.5 years for middle-class life  
+    **2024**: {total_timeline_2024:.1f} years for the same life
+    
+    **The system stole {total_timeline_2024 - years_1970:.1f} years** of your life.
+    """)
+    
+    render_purchasing_power_timeline()
+
+@st.fragment
+@instrumented
+def render_purchasing_power_timeline():
+    """Up to a century of fiat vs hard money purchasing power, downsampled to the chart width"""
+    
+    st.markdown("### Where This Road Leads")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        years = st.slider("Years ahead", 10, TIMELINE_MAX_YEARS, TIMELINE_MAX_YEARS, step=10,
+                          key="timeline_years")
+    with col2:
+        resolution = st.radio("Resolution", list(TIMELINE_RESOLUTIONS), index=1, horizontal=True,
+                              key="timeline_resolution")
+    
+    timeline = purchasing_power_timeline(years, TIMELINE_RESOLUTIONS[resolution])
+    
+    # The chart is log-scaled, so shape is judged on log values
+    log_values = np.log10(np.vstack([timeline['fiat'], timeline['hard_money']]))
+    kept = lttb_indices(timeline['years'], log_values, CHART_WIDTH_PX // TIMELINE_PX_PER_POINT)
+    
+    render_chart(build_timeline_figure(timeline, kept))
+    
+    st.markdown(f"""
+    After {years} years a fiat dollar buys **{timeline['fiat'][-1]:.2g}** of what it buys today.
+    
+    *Projected at a fixed {INFLATION_RATE:.0%} inflation and {BITCOIN_ANNUAL_APPRECIATION:.0%}
+    hard money appreciation a year, with {len(timeline['years']):,} {resolution.lower()} points
+    per line; the chart draws the {len(kept):,} that best keep its shape.*
+    """)
+
+def build_timeline_figure(timeline, kept):
+    """Purchasing power of one dollar in fiat and hard money at the kept timeline points"""
+    
+    fig = go.Figure()
+    for name, color, label in (
+        ('fiat', '#dc2626', 'Fiat Dollar'),
+        ('hard_money', '#f7931a', 'Hard Money'),
+    ):
+        fig.add_trace(go.Scatter(
+            x=chart_values(timeline['years'][kept]),
+            y=chart_values(timeline[name][kept]),
+            mode='lines',
+            name=label,
+            line=dict(color=color, width=2),
+        ))
+    fig.update_layout(
+        title="What Today's Dollar Buys",
+        xaxis_title='Years From Now',
+        yaxis_title='Purchasing Power (log scale)',
+        yaxis_type='log',
+        height=400,
+        showlegend=True
+    )
+    return fig
+
+def build_purchasing_power_figure():
+    """Build the 1970 vs 2024 middle-class timeline bar chart"""
+    
     fig = go.Figure()
     
     categories = ['1970 (Sound Money)', '2024 (Unlimited Money)']
-    timelines = [years_1970, total_timeline_2024]
+    timelines = list(middle_class_timelines())
     
     fig.add_trace(go.Bar(
         x=categories,
@@ -536,15 +1508,9 @@ def render_purchasing_power_theft():
         showlegend=False
     )
     
-    st.plotly_chart(fig, use_container_width=True)
-    
-    st.markdown(f"""
-    **1970**: 2.5 years for middle-class life  
-    **2024**: {total_timeline_2024:.1f} years for the same life
-    
-    **The system stole {total_timeline_2024 - years_1970:.1f} years** of your life.
-    """)
+    return fig
 
+@instrumented
 def render_hero_seeks_understanding():
     """Render Pillar 3: A Hero Seeks Freedom"""
     
@@ -576,35 +1542,50 @@ def render_hero_seeks_understanding():
     """)
     
     # Navigation
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        if st.button("← Your Time Has Value", type="secondary"):
-            st.session_state.current_page = 'time_has_value'
-            st.rerun()
-    
-    with col2:
-        if st.button("Same Rules for Everyone →", type="primary"):
-            st.session_state.current_page = 'same_rules_for_everyone'
-            st.rerun()
+    render_navigation("← Your Time Has Value", "Same Rules for Everyone →")
 
+@instrumented
 def render_cantillon_effect():
     """Show who benefits from the time theft"""
     
     # Show wealth transfer visualization
-    years = ['1971', '1980', '1990', '2000', '2010', '2020', '2024']
+    render_chart(*get_static_figure('cantillon_effect'))
+    
+    # The hard-hitting revelation
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("1971: Bottom 50%", "25%", "Quarter of all wealth")
+    with col2:
+        st.metric("2024: Bottom 50%", "2%", "⬇️ 92% DECLINE")
+    
+    st.markdown("""
+    ### The Time Theft Machine
+    
+    **This isn't an accident. This isn't market forces. This is theft.**
+    
+    **The system works exactly as designed:**
+    1. **Print unlimited money** → Give to banks first
+    2. **Banks buy assets** → Prices rise for everyone else  
+    3. **Your wages stay flat** → You can afford less each year
+    4. **Repeat forever** → Transfer wealth from workers to owners
+    
+    **Your time is being systematically stolen and transferred to those who create money from nothing.**
     
-    # Wealth share percentages (more dramatic to show the theft)
-    top_1_pct = [10, 15, 22, 28, 35, 40, 45]     # Growing share
-    bottom_50_pct = [25, 22, 18, 15, 10, 7, 2]    # Shrinking share
+    **A hero doesn't accept being robbed. A hero finds a way out.**
+    """)
+
+def build_cantillon_figure():
+    """Build the wealth share transfer line chart"""
+    
+    years = [str(year) for year in WEALTH_YEARS]
     
     fig = go.Figure()
     
-    # Top 1% line
+    # Top 1% line - growing share
     fig.add_trace(go.Scatter(
         name='Top 1% Wealth Share',
         x=years,
-        y=top_1_pct,
+        y=chart_values(history_series('top_1_wealth_share_pct', WEALTH_YEARS)),
         mode='lines+markers',
         line=dict(color='darkred', width=4),
         marker=dict(size=12),
@@ -612,11 +1593,11 @@ def render_cantillon_effect():
         fillcolor='rgba(139, 0, 0, 0.1)'
     ))
     
-    # Bottom 50% line
+    # Bottom 50% line - shrinking share
     fig.add_trace(go.Scatter(
         name='Bottom 50% Wealth Share',
         x=years,
-        y=bottom_50_pct,
+        y=chart_values(history_series('bottom_50_wealth_share_pct', WEALTH_YEARS)),
         mode='lines+markers',
         line=dict(color='darkblue', width=4),
         marker=dict(size=12),
@@ -630,31 +1611,17 @@ def render_cantillon_effect():
         showlegend=True
     )
     
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # The hard-hitting revelation
-    col1, col2 = st.columns(2)
-    with col1:
-        st.metric("1971: Bottom 50%", "25%", "Quarter of all wealth")
-    with col2:
-        st.metric("2024: Bottom 50%", "2%", "⬇️ 92% DECLINE")
-    
-    st.markdown("""
-    ### The Time Theft Machine
-    
-    **This isn't an accident. This isn't market forces. This is theft.**
-    
-    **The system works exactly as designed:**
-    1. **Print unlimited money** → Give to banks first
-    2. **Banks buy assets** → Prices rise for everyone else  
-    3. **Your wages stay flat** → You can afford less each year
-    4. **Repeat forever** → Transfer wealth from workers to owners
-    
-    **Your time is being systematically stolen and transferred to those who create money from nothing.**
-    
-    **A hero doesn't accept being robbed. A hero finds a way out.**
-    """)
+    return fig
+
+STATIC_FIGURE_BUILDERS = {
+    'college_crisis': build_college_crisis_figure,
+    'housing_crisis': build_housing_crisis_figure,
+    'family_crisis': build_family_crisis_figure,
+    'purchasing_power_theft': build_purchasing_power_figure,
+    'cantillon_effect': build_cantillon_figure,
+}
 
+@instrumented
 def render_same_rules_for_everyone():
     """Render Pillar 4: Same Rules for Everyone (the universal standard)"""
     st.title("Same Rules for Everyone")
@@ -669,28 +1636,62 @@ def render_same_rules_for_everyone():
     Enter your total monthly or annual expenses in USD below. We'll show you the difference between the fiat standard and the hard money standard.
     """)
 
-    # User input
-    expense = st.number_input(
-        "Your Expenses (USD)",
-        min_value=1,
-        value=2000,
-        step=1,
-        help="Enter your total monthly or annual expenses in USD.",
-        key="expense_input_1"
-    )
+    # Only the calculator reruns when the expense changes
+    if BROWSER_CALCULATORS:
+        render_browser_calculator(
+            'hard_money',
+            inflation_rate=INFLATION_RATE,
+            appreciation_rate=BITCOIN_ANNUAL_APPRECIATION,
+            years=YEARS,
+            key="browser_hard_money",
+        )
+    else:
+        render_hard_money_calculator()
+    
+    render_savings_explorer()
+    
+    render_sensitivity_explorer()
+    
+    render_monte_carlo()
+
+    st.markdown("""
+    ---
+    > **With hard money, your expenses don't just stay the same—they get dramatically cheaper over time.**  
+    > This is the power of saving in money that appreciates faster than fiat debases.
+    
+    **Hard money's 35% annual appreciation vs fiat's 10% debasement = 25% net advantage per year**
+    
+    *Ready to discover what this revolutionary money is?*
+    """)
 
-    # Assumptions
-    INFLATION_RATE = 0.10  # 10% per year (fiat debasement)
-    BITCOIN_ANNUAL_APPRECIATION = 0.35  # 35% per year (historical power law average)
-    NET_BITCOIN_ADVANTAGE = BITCOIN_ANNUAL_APPRECIATION - INFLATION_RATE  # 25% net advantage
-    YEARS = 10
+    # Navigation
+    render_navigation("← Seek Understanding", "The Hero's Triumph →")
+
+@st.fragment
+@instrumented
+def render_hard_money_calculator():
+    """Fiat vs hard money expense calculator, rerun in isolation from the page"""
+
+    # User input - Enter submits, so typing doesn't rerun per keystroke
+    with st.form("hard_money_form", border=False):
+        expense = st.number_input(
+            "Your Expenses (USD)",
+            min_value=1,
+            value=session_record().expense,
+            step=1,
+            help="Enter your total monthly or annual expenses in USD.",
+            key="expense_input_1"
+        )
+        st.form_submit_button("Calculate")
+    session_record().expense = expense
+    persist_session()
 
     # Calculations
-    future_fiat_expense = expense * ((1 + INFLATION_RATE) ** YEARS)
+    trajectory = savings_trajectory(float(expense))
+    future_fiat_expense = trajectory['fiat_expense'][-1]
     
     # Hard money purchasing power increases over time (expenses get cheaper in hard money terms)
-    hard_money_purchasing_power_multiplier = (1 + NET_BITCOIN_ADVANTAGE) ** YEARS  # ~9.3x purchasing power
-    hard_money_expense_future = expense / hard_money_purchasing_power_multiplier
+    hard_money_expense_future = trajectory['hard_money_expense'][-1]  # ~9.3x purchasing power
     hard_money_savings = future_fiat_expense - hard_money_expense_future
 
     # Pie Chart 1: Future Cost in Fiat (change color to blue)
@@ -736,10 +1737,10 @@ def render_same_rules_for_everyone():
     # Show charts side by side
     col1, col2 = st.columns(2)
     with col1:
-        st.plotly_chart(fig1, use_container_width=True)
+        render_chart(fig1)
         st.markdown(f"**In 10 years, your expenses in fiat will be:**\n\n**${future_fiat_expense:,.2f}**")
     with col2:
-        st.plotly_chart(fig2, use_container_width=True)
+        render_chart(fig2)
         st.markdown(f"**With hard money, your expenses become:**\n\n**${hard_money_expense_future:,.2f}**\n\n**Hard Money Savings:** **${hard_money_savings:,.2f}**")
     
     # Calculate and emphasize the percentage improvement
@@ -752,27 +1753,270 @@ def render_same_rules_for_everyone():
     This is the power of money that gets stronger instead of weaker over time.
     """)
 
-    st.markdown("""
-    ---
-    > **With hard money, your expenses don't just stay the same—they get dramatically cheaper over time.**  
-    > This is the power of saving in money that appreciates faster than fiat debases.
+@st.fragment
+@instrumented
+def render_savings_explorer():
+    """Scrub horizon and rate sliders over the monthly savings trajectory"""
     
-    **Hard money's 35% annual appreciation vs fiat's 10% debasement = 25% net advantage per year**
+    st.markdown("### Explore the Future")
     
-    *Ready to discover what this revolutionary money is?*
-    """)
+    col1, col2 = st.columns(2)
+    with col1:
+        years = st.slider("Years", 1, MAX_TRAJECTORY_YEARS, YEARS, key="explorer_years")
+        monthly_contribution = st.slider(
+            "Monthly savings (USD)", 0, 5000, 500, step=50, key="explorer_contribution"
+        )
+    with col2:
+        inflation_pct = st.slider(
+            "Fiat inflation (%/year)", 0, 30, int(INFLATION_RATE * 100), key="explorer_inflation"
+        )
+        appreciation_pct = st.slider(
+            "Hard money appreciation (%/year)", 0, 100, int(BITCOIN_ANNUAL_APPRECIATION * 100),
+            key="explorer_appreciation"
+        )
+    
+    expense = float(session_record().expense)
+    trajectory = savings_trajectory(
+        expense, float(monthly_contribution), inflation_pct / 100, appreciation_pct / 100, years
+    )
+    # Monthly points: x0/dx instead of shipping the same x array with every trace
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        name='Savings in Fiat',
+        x0=0, dx=1 / 12,
+        y=chart_values(trajectory['fiat_savings']),
+        line=dict(color='#2563eb', width=3),
+    ))
+    fig.add_trace(go.Scatter(
+        name='Savings in Hard Money',
+        x0=0, dx=1 / 12,
+        y=chart_values(trajectory['hard_money_savings']),
+        line=dict(color='#f7931a', width=3),
+    ))
+    fig.update_layout(
+        title='Purchasing Power of Your Savings (Today\'s Dollars)',
+        xaxis_title='Years',
+        yaxis_title='Purchasing Power (USD)',
+        height=400,
+        showlegend=True
+    )
+    render_chart(fig)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric(f"Fiat Savings After {years} Years", f"${trajectory['fiat_savings'][-1]:,.0f}",
+                  f"Expenses grow to ${trajectory['fiat_expense'][-1]:,.0f}", delta_color="off")
+    with col2:
+        st.metric(f"Hard Money Savings After {years} Years",
+                  f"${trajectory['hard_money_savings'][-1]:,.0f}",
+                  f"Expenses shrink to ${trajectory['hard_money_expense'][-1]:,.2f}",
+                  delta_color="off")
 
-    # Navigation
+@st.fragment
+@instrumented
+def render_sensitivity_explorer():
+    """Heatmaps of the hard money advantage, read from the precomputed sensitivity grid"""
+    
+    st.markdown("### How Sensitive Is the Advantage?")
+    st.markdown("*Every combination of inflation, appreciation and horizon, computed once.*")
+    
+    view = st.selectbox("Heatmap", list(SENSITIVITY_VIEWS), key="sensitivity_view")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        inflation_pct = st.slider("Fiat inflation (%/year)", 0.0, 30.0, INFLATION_RATE * 100, 0.1,
+                                  key="sensitivity_inflation")
+    with col2:
+        appreciation_pct = st.slider("Hard money appreciation (%/year)", 0.0, 100.0,
+                                     BITCOIN_ANNUAL_APPRECIATION * 100, 0.1,
+                                     key="sensitivity_appreciation")
+    with col3:
+        years = st.slider("Horizon (years)", 1.0, float(MAX_TRAJECTORY_YEARS), float(YEARS), 0.5,
+                          key="sensitivity_years")
+    
+    point = {'inflation_rate': inflation_pct / 100, 'appreciation_rate': appreciation_pct / 100,
+             'years': years}
+    y_name, x_name, fixed_name = SENSITIVITY_VIEWS[view]
+    
+    # Off-grid slider values interpolate between the neighbouring grid slices
+    heatmap = sensitivity_slice(**{fixed_name: point[fixed_name]})
+    render_chart(build_sensitivity_figure(heatmap, y_name, x_name, point))
+    
+    st.metric("Hard Money Savings at These Settings", f"{sensitivity_lookup(**point):.1f}%",
+              "Interpolated from the precomputed grid", delta_color="off")
+
+def build_sensitivity_figure(heatmap, y_name, x_name, point):
+    """Savings percentage heatmap over two parameters, with the current settings marked"""
+    
+    y_label, y_scale = SENSITIVITY_LABELS[y_name]
+    x_label, x_scale = SENSITIVITY_LABELS[x_name]
+    y_values = SENSITIVITY_AXES[y_name][::SENSITIVITY_DISPLAY_STRIDE[y_name]] * y_scale
+    x_values = SENSITIVITY_AXES[x_name][::SENSITIVITY_DISPLAY_STRIDE[x_name]] * x_scale
+    
+    # Whole percents from -100 (fiat wins) to 100 fit in int8 - a quarter of the float32 payload
+    z = heatmap[::SENSITIVITY_DISPLAY_STRIDE[y_name], ::SENSITIVITY_DISPLAY_STRIDE[x_name]]
+    z = np.clip(np.round(z), -100, 100).astype(np.int8)
+    
+    fig = go.Figure()
+    fig.add_trace(go.Heatmap(
+        z=z,
+        x0=x_values[0], dx=round(x_values[1] - x_values[0], 6),
+        y0=y_values[0], dy=round(y_values[1] - y_values[0], 6),
+        zmin=-100, zmax=100,
+        colorscale=SENSITIVITY_COLORSCALE,
+        colorbar=dict(title='Savings %'),
+        hovertemplate=f"{x_label}: %{{x}}<br>{y_label}: %{{y}}<br>Savings: %{{z}}%<extra></extra>",
+    ))
+    fig.add_trace(go.Scatter(
+        x=[point[x_name] * x_scale],
+        y=[point[y_name] * y_scale],
+        mode='markers',
+        marker=dict(symbol='x', size=12, color='black'),
+        showlegend=False,
+        hoverinfo='skip',
+    ))
+    fig.update_layout(
+        title='Hard Money Savings vs Fiat Expenses',
+        xaxis_title=x_label,
+        yaxis_title=y_label,
+        height=400
+    )
+    return fig
+
+@st.fragment
+@instrumented
+def render_monte_carlo():
+    """Stochastic fiat vs hard money scenarios with p5/p50/p95 bands"""
+    
+    st.markdown("### What If the Future Is Uncertain?")
+    st.markdown("*Simulate thousands of possible futures instead of one fixed rate.*")
+    
+    with st.form("monte_carlo_form", border=False):
+        col1, col2 = st.columns(2)
+        with col1:
+            inflation_pct = st.number_input("Average inflation (%/year)", 0.0, 30.0,
+                                            INFLATION_RATE * 100, step=0.5)
+            inflation_volatility_pct = st.number_input("Inflation volatility (%)", 0.0, 20.0,
+                                                       INFLATION_VOLATILITY * 100, step=0.5)
+            distribution = st.selectbox("Shocks", ["normal", "fat_tailed"],
+                                        format_func=lambda d: d.replace('_', '-').title())
+        with col2:
+            appreciation_pct = st.number_input("Average hard money appreciation (%/year)", 0.0,
+                                               100.0, BITCOIN_ANNUAL_APPRECIATION * 100, step=1.0)
+            appreciation_volatility_pct = st.number_input(
+                "Appreciation volatility (%)", 0.0, 150.0, APPRECIATION_VOLATILITY * 100, step=5.0
+            )
+            paths = st.select_slider("Simulated futures", [10_000, 50_000, 100_000, 200_000],
+                                     value=MONTE_CARLO_PATHS)
+        submitted = st.form_submit_button("Run Simulation")
+    
+    scenario = {
+        'expense': float(session_record().expense),
+        'monthly_contribution': float(st.session_state.get('explorer_contribution', 500)),
+        'years': int(st.session_state.get('explorer_years', YEARS)),
+        'distribution': distribution,
+        'inflation_rate': inflation_pct / 100,
+        'inflation_volatility': inflation_volatility_pct / 100,
+        'appreciation_rate': appreciation_pct / 100,
+        'appreciation_volatility': appreciation_volatility_pct / 100,
+    }
+    
+    # Simulations run on the job runner; this fragment only polls for the result
+    if submitted:
+        pool = get_simulation_pool()
+        submit_job('monte_carlo', lambda scenario, paths, progress: cached_result(
+            'run_monte_carlo',
+            lambda scenario, paths: run_monte_carlo(scenario, paths, 0, pool, progress),
+            scenario=scenario, paths=paths,
+        ), scenario=scenario, paths=paths)
+    
+    job = session_record().jobs.get('monte_carlo')
+    if job is None:
+        return
+    
+    render_job(job, "⏳ Simulating futures...", render_monte_carlo_result)
+
+def render_monte_carlo_result(job):
+    """The finished simulation: p5-p95 bands for expenses and savings, and the savings range"""
+    
+    try:
+        bands = job.result()
+    except Exception as err:
+        st.error(f"Simulation failed - a hero adapts: {err}")
+        return
+    job_scenario, job_paths = job.inputs['scenario'], job.inputs['paths']
+    
     col1, col2 = st.columns(2)
     with col1:
-        if st.button("← Seek Understanding", type="secondary"):
-            st.session_state.current_page = 'hero_seeks_understanding'
-            st.rerun()
+        render_chart(build_band_figure(
+            bands, ('fiat_expense', 'hard_money_expense'),
+            'Future Expenses (p5-p95)', 'Expenses (USD)'
+        ))
     with col2:
-        if st.button("The Hero's Triumph →", type="primary"):
-            st.session_state.current_page = 'heros_triumph'
-            st.rerun()
+        render_chart(build_band_figure(
+            bands, ('fiat_savings', 'hard_money_savings'),
+            'Savings Purchasing Power (p5-p95)', 'Purchasing Power (USD)'
+        ))
+    
+    low, median, high = bands['hard_money_savings'][:, -1]
+    st.markdown(f"""
+    **Across {job_paths:,} simulated futures**, hard money savings after
+    {job_scenario['years']} years land between **${low:,.0f}** and **${high:,.0f}**
+    (median **${median:,.0f}**).
+    """)
 
+def render_job(job, text, render_result):
+    """Render a finished job's result, or poll a running one until it finishes"""
+    
+    if job.done():
+        render_result(job)
+    else:
+        render_job_progress(job, text)
+
+@st.fragment(run_every=JOB_POLL_SECONDS)
+@instrumented
+def render_job_progress(job, text):
+    """Poll a running job without holding the script thread
+    
+    Once the job is done, one app rerun lets render_job draw the result with no poller left
+    behind - a fragment can't stop its own timer, and rerunning only it would keep polling.
+    """
+    
+    if job.done():
+        st.rerun(scope="app")
+    st.progress(job.progress, text=text)
+
+def build_band_figure(bands, series_pair, title, yaxis_title):
+    """Percentile band chart over whole years: shaded p5-p95 range with a p50 line per series"""
+    
+    colors = {
+        'fiat_expense': ('#2563eb', 'rgba(37, 99, 235, 0.2)', 'Fiat'),
+        'hard_money_expense': ('#f7931a', 'rgba(247, 147, 26, 0.2)', 'Hard Money'),
+        'fiat_savings': ('#2563eb', 'rgba(37, 99, 235, 0.2)', 'Fiat'),
+        'hard_money_savings': ('#f7931a', 'rgba(247, 147, 26, 0.2)', 'Hard Money'),
+    }
+    
+    fig = go.Figure()
+    for series in series_pair:
+        line_color, band_color, name = colors[series]
+        low, median, high = bands[series]
+        fig.add_trace(go.Scatter(y=chart_values(high), line=dict(width=0), showlegend=False,
+                                 hoverinfo='skip'))
+        fig.add_trace(go.Scatter(y=chart_values(low), line=dict(width=0), fill='tonexty',
+                                 fillcolor=band_color, showlegend=False, hoverinfo='skip'))
+        fig.add_trace(go.Scatter(name=name, y=chart_values(median),
+                                 line=dict(color=line_color, width=3)))
+    
+    fig.update_layout(
+        title=title,
+        xaxis_title='Years',
+        yaxis_title=yaxis_title,
+        yaxis_type='log',
+        height=400,
+        showlegend=True
+    )
+    return fig
+
+@instrumented
 def render_heros_triumph():
     """Render the final page: The Hero's Next Step – Call to Action"""
     st.title("The Hero's Next Step")
@@ -843,9 +2087,66 @@ def render_heros_triumph():
     
     # Navigation - moved to bottom
     st.markdown("---")
-    if st.button("← Back to Same Rules", type="secondary"):
-        st.session_state.current_page = 'same_rules_for_everyone'
-        st.rerun()
+    st.button("← Back to Same Rules", type="secondary",
+              on_click=go_to_page, args=(PAGES['heros_triumph']['prev'],))
+
+# Page registry: page id -> render function and journey links
+PAGES = {
+    'landing': {
+        'render': render_landing_page,
+        'charts': False,
+        'figures': (),
+        'data': (),
+        'jobs': (),
+        'prev': None,
+        'next': 'question_everything',
+    },
+    'question_everything': {
+        'render': render_question_everything,
+        'charts': True,
+        'figures': ('college_crisis', 'housing_crisis', 'family_crisis'),
+        'data': (),
+        'jobs': (),
+        'prev': 'landing',
+        'next': 'time_has_value',
+    },
+    'time_has_value': {
+        'render': render_time_has_value,
+        'charts': True,
+        'figures': ('purchasing_power_theft',),
+        'data': (get_wage_distribution, purchasing_power_path),
+        'jobs': ('workforce',),
+        'prev': 'question_everything',
+        'next': 'hero_seeks_understanding',
+    },
+    'hero_seeks_understanding': {
+        'render': render_hero_seeks_understanding,
+        'charts': True,
+        'figures': ('cantillon_effect',),
+        'data': (),
+        'jobs': (),
+        'prev': 'time_has_value',
+        'next': 'same_rules_for_everyone',
+    },
+    'same_rules_for_everyone': {
+        'render': render_same_rules_for_everyone,
+        'charts': True,
+        'figures': (),
+        'data': (sensitivity_grid,),
+        'jobs': ('monte_carlo',),
+        'prev': 'hero_seeks_understanding',
+        'next': 'heros_triumph',
+    },
+    'heros_triumph': {
+        'render': render_heros_triumph,
+        'charts': False,
+        'figures': (),
+        'data': (),
+        'jobs': (),
+        'prev': 'same_rules_for_everyone',
+        'next': None,
+    },
+}
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()